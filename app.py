@@ -1,78 +1,47 @@
 import streamlit as st
-from utils.auth import login, logout
-from typing import Dict
+from streamlit.navigation.page import StreamlitPage
+from types import MappingProxyType, SimpleNamespace
+from typing import Dict, Mapping, Tuple
+from utils.constants import Role
 
 # Set up the app title and layout
 st.set_page_config(page_title="North Avenue Automobile", layout="wide")
 st.logo("assets/icon.png")
-st.html(
-    """
-  <style>
-    [alt=Logo] {
-        top: -10px; 
-        height: 6rem;
-        margin-bottom: -20px;
-        margin-left: -20px;
-    }
-  </style>
-        """
-)
-
-# Initialize session state for login status and username
-st.session_state.setdefault("logged_in", False)
-st.session_state.setdefault("username", "")
-st.session_state.setdefault("show_reports", False)
-
-# Define application pages
-search_page = st.Page(
-    "pages/search.py", title="Search", icon=":material/search:", default=True
-)
-login_page = st.Page(login, title="Log in", icon=":material/login:")
-logout_page = st.Page(logout, title="Log out", icon=":material/logout:")
-add_parts_page = st.Page(
-    "pages/add_parts_order.py", title="Add Parts Order", icon=":material/extension:"
-)
-add_vehicle_page = st.Page(
-    "pages/add_vehicle.py", title="Add Vehicle", icon=":material/directions_car:"
-)
-sell_vehicle_page = st.Page(
-    "pages/sell_vehicle.py", title="Sell Vehicle", icon=":material/sell:"
-)
-details_page = st.Page(
-    "pages/details.py", title="View Details", icon=":material/manage_search:"
-)
-
-# Define report pages
-seller_history = st.Page(
-    "pages/reports/seller_history.py",
-    title="Seller History Report",
-    icon=":material/timeline:",
-)
-avt = st.Page(
-    "pages/reports/average_inventory_time.py",
-    title="AVT Report",
-    icon=":material/avg_time:",
-)
-ppc = st.Page(
-    "pages/reports/price_per_condition.py",
-    title="PPC Report",
-    icon=":material/bar_chart:",
-)
-parts_statistics = st.Page(
-    "pages/reports/parts_statistics.py",
-    title="Parts Statistics Report",
-    icon=":material/table_chart:",
-)
-monthly_sales = st.Page(
-    "pages/reports/monthly_sales.py",
-    title="Monthly Sales Report",
-    icon=":material/chart_data:",
-)
-
-
-def show_sidebar_welcome() -> None:
-    """
-    Displays a welcome message in the sidebar for logged-in users.
+
+
+@st.cache_data
+def load_css(path: str) -> str:
+    """
+    Reads a stylesheet once per process and wraps it in a style tag.
+
+    Parameters:
+        path (str): Path to the CSS file.
+
+    Returns:
+        str: The stylesheet wrapped in a <style> tag.
+    """
+    with open(path, "r") as file:
+        return f"<style>{file.read()}</style>"
+
+
+# Emit the cached stylesheet; Streamlit drops elements not re-emitted on a rerun
+st.html(load_css("assets/logo.css"))
+
+# Initialize session state for login status and username once per session
+if "_initialized" not in st.session_state:
+    st.session_state.update(
+        {
+            "logged_in": False,
+            "username": "",
+            "show_reports": False,
+            "_initialized": True,
+        }
+    )
+
+
+def login() -> None:
+    """
+    Renders the login page, importing the authentication module on first use.
 
     Parameters:
         None
@@ -80,87 +49,217 @@ def show_sidebar_welcome() -> None:
     Returns:
         None
     """
-    st.sidebar.write(f"**Welcome, {st.session_state['username']}!**")
+    from utils.auth import login as auth_login
+
+    auth_login()
 
 
-def get_navigation_by_role(role: str) -> Dict[str, list]:
+def logout() -> None:
     """
-    Returns the navigation structure based on the user's role.
+    Logs out the user, importing the authentication module on first use.
 
     Parameters:
-        role (str): The role of the logged-in user.
+        None
 
     Returns:
-        dict: A dictionary representing navigation options.
+        None
+    """
+    from utils.auth import logout as auth_logout
+
+    auth_logout()
+
+
+@st.cache_resource
+def _build_pages() -> SimpleNamespace:
+    """
+    Builds the application pages once per process so reruns reuse them.
+
+    Parameters:
+        None
+
+    Returns:
+        SimpleNamespace: The application pages, keyed by name.
+    """
+    return SimpleNamespace(
+        # Define application pages
+        search=st.Page(
+            "pages/search.py", title="Search", icon=":material/search:", default=True
+        ),
+        login=st.Page(login, title="Log in", icon=":material/login:"),
+        logout=st.Page(logout, title="Log out", icon=":material/logout:"),
+        add_parts=st.Page(
+            "pages/add_parts_order.py",
+            title="Add Parts Order",
+            icon=":material/extension:",
+        ),
+        add_vehicle=st.Page(
+            "pages/add_vehicle.py",
+            title="Add Vehicle",
+            icon=":material/directions_car:",
+        ),
+        sell_vehicle=st.Page(
+            "pages/sell_vehicle.py", title="Sell Vehicle", icon=":material/sell:"
+        ),
+        details=st.Page(
+            "pages/details.py", title="View Details", icon=":material/manage_search:"
+        ),
+    )
+
+
+@st.cache_resource
+def _report_pages() -> Tuple[StreamlitPage, ...]:
+    """
+    Builds the report pages on first use, so sessions without reports never create them.
+
+    Parameters:
+        None
+
+    Returns:
+        tuple: The report pages in navigation order.
     """
-    common_pages = {"Tools": [search_page]}
+    return (
+        st.Page(
+            "pages/reports/seller_history.py",
+            title="Seller History Report",
+            icon=":material/timeline:",
+        ),
+        st.Page(
+            "pages/reports/average_inventory_time.py",
+            title="AVT Report",
+            icon=":material/avg_time:",
+        ),
+        st.Page(
+            "pages/reports/price_per_condition.py",
+            title="PPC Report",
+            icon=":material/bar_chart:",
+        ),
+        st.Page(
+            "pages/reports/parts_statistics.py",
+            title="Parts Statistics Report",
+            icon=":material/table_chart:",
+        ),
+        st.Page(
+            "pages/reports/monthly_sales.py",
+            title="Monthly Sales Report",
+            icon=":material/chart_data:",
+        ),
+    )
 
+
+@st.cache_resource
+def _navigation_table() -> Tuple[Mapping[str, Tuple[StreamlitPage, ...]], ...]:
+    """
+    Builds the complete navigation structure for every role once per process.
+
+    Sections are tuples wrapped in read-only mappings so the shared templates
+    cannot be modified by callers.
+
+    Parameters:
+        None
+
+    Returns:
+        tuple: The pre-merged navigation structures, indexed by Role.
+    """
+    pages = _build_pages()
     role_specific_pages = {
-        "Inventory clerk": {
-            "Role Action": [details_page, add_parts_page, add_vehicle_page]
+        Role.INVENTORY_CLERK: {
+            "Role Action": (pages.details, pages.add_parts, pages.add_vehicle)
         },
-        "Salesperson": {"Role Action": [details_page, sell_vehicle_page]},
-        "Manager": {"Role Action": [details_page]},
-        "Owner": {
-            "Role Action": [
-                details_page,
-                add_parts_page,
-                add_vehicle_page,
-                sell_vehicle_page,
-            ]
+        Role.SALESPERSON: {"Role Action": (pages.details, pages.sell_vehicle)},
+        Role.MANAGER: {"Role Action": (pages.details,)},
+        Role.OWNER: {
+            "Role Action": (
+                pages.details,
+                pages.add_parts,
+                pages.add_vehicle,
+                pages.sell_vehicle,
+            )
         },
+        Role.PUBLIC: {},
     }
+    return tuple(
+        MappingProxyType({"Tools": (pages.search,), **role_specific_pages[role]})
+        for role in Role
+    )
 
-    return {**common_pages, **role_specific_pages.get(role, {})}
 
-
-def display_navigation() -> None:
+def get_navigation_by_role(role_id: Role) -> Mapping[str, Tuple[StreamlitPage, ...]]:
     """
-    Displays the navigation menu based on the user's login status and role.
+    Returns the read-only navigation structure based on the user's role.
 
     Parameters:
-        None
+        role_id (Role): The role of the logged-in user.
 
     Returns:
-        None
+        Mapping: A read-only mapping of section names to page tuples.
     """
+    return _navigation_table()[role_id]
 
-    if st.session_state["logged_in"]:
-        show_sidebar_welcome()
-        user_role = st.session_state.get("role", "")
-        navigation_structure = get_navigation_by_role(user_role)
 
-        if st.session_state.get("show_reports", False):
-            navigation_structure.update(
-                {"Reports": [seller_history, avt, ppc, parts_statistics, monthly_sales]}
-            )
+def build_navigation(
+    logged_in: bool, role_id: Role, show_reports: bool
+) -> Dict[str, Tuple[StreamlitPage, ...]]:
+    """
+    Builds the navigation structure for the given login status, role and report flag.
 
-        # Add "Account" as the last item in the navigation
-        navigation_structure["Account"] = [logout_page]
+    Parameters:
+        logged_in (bool): Whether a user is logged in.
+        role_id (Role): The role of the logged-in user.
+        show_reports (bool): Whether the Reports section should be shown.
 
-    else:
-        st.session_state["show_reports"] = False
-        navigation_structure = {
-            "Tools": [search_page],
-            "Role Action": [details_page],
-            "Account": [login_page],
+    Returns:
+        dict: A dictionary representing navigation options.
+    """
+    pages = _build_pages()
+
+    if not logged_in:
+        return {
+            "Tools": (pages.search,),
+            "Role Action": (pages.details,),
+            "Account": (pages.login,),
         }
 
-    # Get the current page from query parameters or default to search_page
-    current_page = st.query_params.get("page", ["search"])[0]
+    # Copy the read-only template into a dict before adding sections
+    navigation_structure = dict(get_navigation_by_role(role_id))
+
+    if show_reports:
+        navigation_structure["Reports"] = _report_pages()
+
+    # Add "Account" as the last item in the navigation
+    navigation_structure["Account"] = (pages.logout,)
 
-    # Flatten the navigation structure to a list of pages
-    all_pages = []
-    for pages in navigation_structure.values():
-        all_pages.extend(pages)
+    return navigation_structure
+
+
+def display_navigation() -> None:
+    """
+    Displays the navigation menu based on the user's login status and role.
 
-    # Map page titles to page objects
-    page_dict = {page.title: page for page in all_pages}
+    Parameters:
+        None
+
+    Returns:
+        None
+    """
+
+    # Read session state once; each access goes through Streamlit's state proxy
+    session_state = st.session_state
+    logged_in = session_state.get("logged_in", False)
+    role_id = session_state.get("role_id", Role.PUBLIC)
+    show_reports = session_state.get("show_reports", False)
+
+    if logged_in:
+        # Welcome message is formatted once at login
+        st.sidebar.write(session_state.get("_welcome_md", ""))
+    else:
+        show_reports = session_state["show_reports"] = False
 
-    # If the current page is not in the navigation, reset to default
-    if current_page not in page_dict:
-        current_page = "Search"
-        st.query_params.get(current_page, current_page)
+    # Rebuild the navigation only when the role or flags change between reruns
+    nav_key = (logged_in, role_id, show_reports)
+    if session_state.get("_nav_key") != nav_key:
+        session_state["_nav"] = build_navigation(logged_in, role_id, show_reports)
+        session_state["_nav_key"] = nav_key
+    navigation_structure = session_state["_nav"]
 
     # Render navigation
     pg = st.navigation(navigation_structure)
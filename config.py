@@ -1,44 +1,124 @@
 import os
+import threading
+from dataclasses import dataclass, field
+from urllib.parse import quote_plus
 from dotenv import load_dotenv
-import pymysql
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
 
-# Load environment variables from .env file
-load_dotenv()
+# Load environment variables from .env file at most once per process, even if
+# the module is re-imported by Streamlit's reloader
+if not os.environ.get("_DOTENV_LOADED"):
+    load_dotenv()
+    os.environ["_DOTENV_LOADED"] = "1"
 
+# Prefer the C-based mysqlclient driver and fall back to pure-Python PyMySQL
+try:
+    import MySQLdb  # noqa: F401
 
+    DB_DRIVER = "mysqldb"
+except ImportError:
+    DB_DRIVER = "pymysql"
+
+
+@dataclass(frozen=True)
 class Config:
     """Base configuration with default settings for MySQL database."""
 
     # Database settings for MySQL
-    DB_USER = os.getenv("DB_USER", "root")
-    DB_PASSWORD = os.getenv("DB_PASSWORD", "password")
-    DB_HOST = os.getenv("DB_HOST", "localhost")
-    DB_PORT = os.getenv("DB_PORT", "3306")
-    DB_NAME = os.getenv("DB_NAME", "north_avenue")
+    DB_USER: str = os.getenv("DB_USER", "root")
+    DB_PASSWORD: str = os.getenv("DB_PASSWORD", "password")
+    DB_HOST: str = os.getenv("DB_HOST", "localhost")
+    DB_PORT: str = os.getenv("DB_PORT", "3306")
+    DB_NAME: str = os.getenv("DB_NAME", "north_avenue")
+
+    # Connection pool settings
+    POOL_SIZE: int = 10
+    MAX_OVERFLOW: int = 20
+    POOL_TIMEOUT: int = 5
+    POOL_RECYCLE: int = 1800
 
-    # SQLAlchemy database URI for MySQL
-    SQLALCHEMY_DATABASE_URI = (
-        f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
-    )
+    # Driver-level timeouts (seconds) so a dead host cannot stall a rerun
+    CONNECT_TIMEOUT: int = 5
+    READ_TIMEOUT: int = 10
+    WRITE_TIMEOUT: int = 10
+
+    # Log every SQL statement (SQLAlchemy echo); costly, so opt in with SQL_ECHO=1
+    SQL_ECHO: bool = os.getenv("SQL_ECHO") == "1"
 
     # Secret key for session management (change in production)
-    SECRET_KEY = os.getenv("SECRET_KEY", "your_default_secret_key")
+    SECRET_KEY: str = os.getenv("SECRET_KEY", "your_default_secret_key")
 
     # Streamlit authenticator configuration
-    COOKIE_NAME = "auto_dealership_auth"
-    COOKIE_EXPIRY_DAYS = 1
+    COOKIE_NAME: str = "auto_dealership_auth"
+    COOKIE_EXPIRY_DAYS: int = 1
+
+    # SQLAlchemy database URI for MySQL, resolved once in __post_init__
+    SQLALCHEMY_DATABASE_URI: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        # Quote credentials so characters such as @, / or : do not break the URI
+        user = quote_plus(self.DB_USER)
+        password = quote_plus(self.DB_PASSWORD)
+        object.__setattr__(
+            self,
+            "SQLALCHEMY_DATABASE_URI",
+            f"mysql+{DB_DRIVER}://{user}:{password}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}?charset=utf8mb4",
+        )
 
 
+@dataclass(frozen=True)
 class DevelopmentConfig(Config):
-    DEBUG = True
+    DEBUG: bool = True
 
 
+@dataclass(frozen=True)
 class ProductionConfig(Config):
-    DEBUG = False
+    DEBUG: bool = False
 
 
 # Dictionary to fetch configurations based on the environment
 config = {"development": DevelopmentConfig, "production": ProductionConfig}
 
-# Set up the current config based on the environment
-current_config = config[os.getenv("ENV", "development")]
+# Resolve the current config once, based on the environment
+current_config = config[os.getenv("ENV", "development")]()
+
+# Process-wide engine shared by every Streamlit session and rerun
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_engine() -> Engine:
+    """
+    Returns the shared SQLAlchemy engine, creating it on first use.
+
+    The engine keeps a pool of open MySQL connections so that reruns reuse
+    existing connections instead of reconnecting for every query.
+
+    Parameters:
+        None
+
+    Returns:
+        Engine: The pooled SQLAlchemy engine for the configured database.
+    """
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = create_engine(
+                    current_config.SQLALCHEMY_DATABASE_URI,
+                    poolclass=QueuePool,
+                    pool_size=current_config.POOL_SIZE,
+                    max_overflow=current_config.MAX_OVERFLOW,
+                    pool_timeout=current_config.POOL_TIMEOUT,
+                    pool_pre_ping=True,
+                    pool_recycle=current_config.POOL_RECYCLE,
+                    connect_args={
+                        "connect_timeout": current_config.CONNECT_TIMEOUT,
+                        "read_timeout": current_config.READ_TIMEOUT,
+                        "write_timeout": current_config.WRITE_TIMEOUT,
+                    },
+                    echo=current_config.SQL_ECHO,
+                )
+    return _engine
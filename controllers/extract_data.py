@@ -1,11 +1,425 @@
 import pandas as pd
-from sqlalchemy import text
+import pyarrow as pa
+import re
+from collections import defaultdict
+from functools import lru_cache
+from contextlib import contextmanager
+from sqlalchemy import bindparam, text
 from db.session import create_session
 from typing import List, Optional, Dict
 import streamlit as st
 
+# Seconds a cached read stays valid; writes below clear the caches immediately
+_READ_CACHE_TTL = 300
 
-def search_vehicles(
+# Seconds a cached dropdown source (vendors, lookup tables) stays valid
+_LOOKUP_CACHE_TTL = 3600
+
+# Rows pulled from the DBAPI cursor per fetchmany call in _read_frame
+_FETCH_BATCH_SIZE = 1000
+
+
+def _clear_read_caches():
+    """
+    Clears the cached search, vehicle count, detail, sale and parts, report, vendor and customer ID reads after a successful write.
+    """
+    for cached in (
+        search_vehicles,
+        count_available_and_pending,
+        seller_history_report,
+        average_inventory_time_report,
+        price_per_condition_report,
+        parts_statistics_report,
+        monthly_sales_summary,
+        monthly_sales_drilldown,
+        fetch_vendors,
+        get_vehicle_details_for_public,
+        get_vehicle_details_for_sale,
+        get_vehicle_details,
+        get_vehicle_parts,
+        fetch_customer_id,
+    ):
+        cached.clear()
+
+
+@contextmanager
+def _raw_cursor(session, statement, params=None):
+    """
+    Executes a statement on the raw DBAPI cursor of the session's pooled connection.
+
+    Skips SQLAlchemy's per-row Row construction, which dominates the Python-side
+    cost of large result sets such as vehicle searches and reports.
+
+    Parameters:
+        session (Session): Active SQLAlchemy session.
+        statement (TextClause): The statement to execute.
+        params (dict, optional): Bound parameter values keyed by name.
+
+    Yields:
+        cursor: The executed DBAPI cursor, closed on exit.
+    """
+    connection = session.connection()
+    compiled = statement.compile(dialect=connection.dialect)
+    bound = compiled.construct_params(params or {})
+    if compiled.positional:
+        bound = tuple(bound[name] for name in compiled.positiontup)
+
+    cursor = connection.connection.cursor()
+    try:
+        cursor.execute(str(compiled), bound)
+        yield cursor
+    finally:
+        cursor.close()
+
+
+def _fetch_raw(session, statement, params=None) -> list:
+    """
+    Executes a statement on the raw DBAPI cursor and returns plain tuples.
+
+    Returns:
+        list: The fetched rows as tuples, in SELECT column order.
+    """
+    with _raw_cursor(session, statement, params) as cursor:
+        return cursor.fetchall()
+
+
+def _read_frame(session, statement, params=None) -> pd.DataFrame:
+    """
+    Executes a statement on the raw DBAPI cursor and loads the rows into a DataFrame.
+
+    Rows are pulled in batches of _FETCH_BATCH_SIZE and appended column-wise, so the
+    full result is never held as a list of row tuples next to the DataFrame.
+    Column names come from the cursor description, i.e. the SELECT aliases.
+
+    Returns:
+        pd.DataFrame: The fetched rows.
+    """
+    with _raw_cursor(session, statement, params) as cursor:
+        names = [column[0] for column in cursor.description]
+        columns = [[] for _ in names]
+        while True:
+            batch = cursor.fetchmany(_FETCH_BATCH_SIZE)
+            if not batch:
+                break
+            for values, batch_values in zip(columns, zip(*batch)):
+                values.extend(batch_values)
+        return pd.DataFrame(dict(zip(names, columns)), columns=names)
+
+
+def _to_arrow(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Converts a DataFrame to pyarrow-backed dtypes.
+
+    Streamlit ships DataFrames to the browser as Arrow, so arrow-backed columns
+    pass through without a pandas-to-Arrow conversion, and strings take less memory.
+
+    Parameters:
+        df (pd.DataFrame): The DataFrame to convert.
+
+    Returns:
+        pd.DataFrame: The same data with pd.ArrowDtype columns.
+    """
+    return pa.Table.from_pandas(df, preserve_index=False).to_pandas(
+        types_mapper=pd.ArrowDtype
+    )
+
+
+# Search output columns: alias -> SELECT expression; Colors is filled in by _attach_colors
+_SEARCH_COLUMNS = {
+    "VIN": "v.vehicle_identification_number",
+    "VehicleType": "v.vehicle_type",
+    "Manufacturer": "v.manufacturer_name",
+    "Model": "v.model_name",
+    "Year": "v.year",
+    "FuelType": "v.fuel_type",
+    "Colors": None,
+    "Horsepower": "v.horsepower",
+    # Recorded sale price; unsold vehicles get their list price in _apply_list_price
+    "SalePrice": "st.sale_price",
+    "PurchasePrice": "pt.purchase_price",
+    "PurchaseDate": "pt.purchased_on",
+    "TotalPartsCost": "ROUND(COALESCE(vpc.total_parts_cost, 0), 2)",
+    "Description": "v.description",
+}
+
+# Raw inputs selected alongside SalePrice and consumed by _apply_list_price
+_LIST_PRICE_INPUTS = {
+    "BasePurchasePrice": "pt.purchase_price",
+    "BasePartsCost": "vpc.total_parts_cost",
+}
+
+_PUBLIC_SEARCH_COLUMNS = (
+    "VIN",
+    "VehicleType",
+    "Manufacturer",
+    "Model",
+    "Year",
+    "FuelType",
+    "Colors",
+    "Horsepower",
+    "SalePrice",
+)
+
+# Columns each role may see; roles not listed get every column
+_ROLE_SEARCH_COLUMNS = {
+    "Public": _PUBLIC_SEARCH_COLUMNS,
+    "Salesperson": _PUBLIC_SEARCH_COLUMNS,
+    "Inventory clerk": (
+        "VIN",
+        "VehicleType",
+        "Manufacturer",
+        "Model",
+        "Year",
+        "FuelType",
+        "Colors",
+        "Horsepower",
+        "PurchasePrice",
+        "TotalPartsCost",
+    ),
+}
+
+# Joins shared by every vehicle search; filters and ORDER BY are appended per call
+_SEARCH_VEHICLES_FROM = """
+    FROM Vehicle v
+    LEFT JOIN SaleTransaction st ON v.vehicle_identification_number = st.vehicle_identification_number
+    LEFT JOIN PurchaseTransaction pt ON v.vehicle_identification_number = pt.vehicle_identification_number
+    -- Parts cost per vehicle, maintained by add_parts_order
+    LEFT JOIN VehiclePartsCost vpc ON v.vehicle_identification_number = vpc.vehicle_identification_number
+"""
+
+
+_SEARCH_VEHICLES_ORDER_BY = """
+    ORDER BY v.vehicle_identification_number ASC
+"""
+
+
+def _search_columns(role: str) -> tuple:
+    """
+    Returns the search output columns visible to a role, in display order.
+
+    Parameters:
+        role (str): User role performing the search.
+
+    Returns:
+        tuple: The column aliases.
+    """
+    return _ROLE_SEARCH_COLUMNS.get(role, tuple(_SEARCH_COLUMNS))
+
+
+def _search_projection(role: str) -> str:
+    """
+    Builds the SELECT list for the columns visible to a role.
+
+    Parameters:
+        role (str): User role performing the search.
+
+    Returns:
+        str: The SELECT clause.
+    """
+    columns = {alias: _SEARCH_COLUMNS[alias] for alias in _search_columns(role)}
+    if "SalePrice" in columns:
+        columns.update(_LIST_PRICE_INPUTS)
+    select = ",\n        ".join(
+        f"{expr} AS {alias}" for alias, expr in columns.items() if expr is not None
+    )
+    return f"\n    SELECT\n        {select}"
+
+
+# Colors per vehicle for a page of search results
+_VEHICLE_COLORS_QUERY = text(
+    """
+    SELECT vehicle_identification_number, color_name
+    FROM VehicleColor
+    WHERE vehicle_identification_number IN :vins
+"""
+).bindparams(bindparam("vins", expanding=True))
+
+
+def _vehicle_colors(session, vins: List[str]) -> Dict[str, str]:
+    """
+    Fetches the colors of the given vehicles, grouped per VIN in Python.
+
+    Parameters:
+        session (Session): Active SQLAlchemy session.
+        vins (List[str]): VINs to fetch colors for.
+
+    Returns:
+        Dict[str, str]: Comma-separated, sorted color names keyed by VIN; VINs without colors are absent.
+    """
+    colors = defaultdict(list)
+    if vins:
+        for vin, color_name in session.execute(_VEHICLE_COLORS_QUERY, {"vins": vins}):
+            colors[vin].append(color_name)
+    return {vin: ", ".join(sorted(names)) for vin, names in colors.items()}
+
+
+def _attach_colors(session, df: pd.DataFrame, position: int) -> None:
+    """
+    Inserts the Colors column for the VINs in a vehicle DataFrame, in place.
+
+    Parameters:
+        session (Session): Active SQLAlchemy session.
+        df (pd.DataFrame): Vehicle rows containing a VIN column.
+        position (int): Column index at which to insert Colors.
+
+    Returns:
+        None
+    """
+    colors = _vehicle_colors(session, df["VIN"].tolist())
+    df.insert(position, "Colors", df["VIN"].map(colors))
+
+
+def _apply_list_price(df: pd.DataFrame) -> None:
+    """
+    Fills SalePrice for unsold vehicles with the list price, in place.
+
+    The list price is 125% of the purchase price plus 110% of the parts cost; the
+    raw input columns selected for it are removed from the DataFrame.
+
+    Parameters:
+        df (pd.DataFrame): Search results containing SalePrice and the list price inputs.
+
+    Returns:
+        None
+    """
+    purchase_price = pd.to_numeric(df.pop("BasePurchasePrice"))
+    parts_cost = pd.to_numeric(df.pop("BasePartsCost")).fillna(0)
+    list_price = (1.25 * purchase_price + 1.1 * parts_cost).round(2)
+    df["SalePrice"] = pd.to_numeric(df["SalePrice"]).fillna(list_price)
+
+
+# VINs with at least one part not yet installed, for anti-joins against Vehicle
+_PENDING_PARTS_VINS = """
+    SELECT DISTINCT po_sub.vehicle_identification_number
+    FROM PartsOrder po_sub
+    INNER JOIN Part p ON p.order_number = po_sub.order_number
+    WHERE p.status != 'Installed'
+"""
+
+# Unsold vehicles with no pending parts
+_AVAILABLE_FOR_SALE_FILTER = f"""
+    LEFT JOIN ({_PENDING_PARTS_VINS}) pending
+        ON pending.vehicle_identification_number = v.vehicle_identification_number
+    WHERE st.sale_price IS NULL -- Unsold vehicles only
+    AND pending.vehicle_identification_number IS NULL -- No pending parts
+"""
+
+# Role-Based Filtering, keyed on (role, vehicle_status)
+_SEARCH_ROLE_FILTERS = {
+    ("Public", None): _AVAILABLE_FOR_SALE_FILTER,
+    ("Salesperson", None): _AVAILABLE_FOR_SALE_FILTER,
+    # Show all unsold vehicles, with or without pending parts
+    ("Inventory clerk", None): "WHERE st.sale_price IS NULL",
+    # Managers and Owners see all vehicles unless filtering by status
+    ("Manager", None): "WHERE 1=1",
+    ("Manager", "Sold"): "WHERE st.sale_price IS NOT NULL",
+    ("Manager", "Unsold"): "WHERE st.sale_price IS NULL",
+    ("Owner", None): "WHERE 1=1",
+    ("Owner", "Sold"): "WHERE st.sale_price IS NOT NULL",
+    ("Owner", "Unsold"): "WHERE st.sale_price IS NULL",
+}
+
+
+def _search_role_filter(role: str, vehicle_status: str = None) -> str:
+    """
+    Returns the WHERE clause restricting search results for the given role.
+
+    Parameters:
+        role (str): User role performing the search.
+        vehicle_status (str, optional): Vehicle status filter ("Sold", "Unsold"), used by Managers and Owners.
+
+    Returns:
+        str: The WHERE clause for the role.
+    """
+    if role not in ("Manager", "Owner") or vehicle_status not in ("Sold", "Unsold"):
+        vehicle_status = None
+    return _SEARCH_ROLE_FILTERS.get((role, vehicle_status), "WHERE 1=1")
+
+
+def _fulltext_terms(keyword: str) -> str:
+    """
+    Turns a free-text keyword into a BOOLEAN MODE query requiring every word as a prefix.
+
+    Parameters:
+        keyword (str): The keyword entered by the user.
+
+    Returns:
+        str: The MATCH ... AGAINST search string, or "" if no searchable words remain.
+    """
+    words = re.sub(r'[+\-<>()~*"@]', " ", keyword).split()
+    return " ".join(f"+{word}*" for word in words)
+
+
+# Optional search filters, keyed on the bound parameter each one needs
+_SEARCH_FILTER_CLAUSES = {
+    "vehicle_type": " AND v.vehicle_type = :vehicle_type",
+    "manufacturer": " AND v.manufacturer_name = :manufacturer",
+    "year": " AND v.year = :year",
+    "fuel_type": " AND v.fuel_type = :fuel_type",
+    "color": """
+            AND EXISTS (
+                SELECT 1 FROM VehicleColor vc
+                WHERE vc.vehicle_identification_number = v.vehicle_identification_number
+                  AND vc.color_name = :color
+            )
+            """,
+    "keyword": """
+            AND MATCH(v.manufacturer_name, v.model_name, v.description) AGAINST(:keyword IN BOOLEAN MODE)
+            """,
+    # Numeric keywords also match the model year
+    "year_like": """
+            AND (
+                MATCH(v.manufacturer_name, v.model_name, v.description) AGAINST(:keyword IN BOOLEAN MODE) OR
+                CAST(v.year AS CHAR) LIKE :year_like
+            )
+            """,
+    # Keywords with no full-text words left (only operators or spaces) match as plain text
+    "keyword_like": """
+            AND (
+                v.manufacturer_name LIKE :keyword_like OR
+                v.model_name LIKE :keyword_like OR
+                CAST(v.year AS CHAR) LIKE :keyword_like OR
+                v.description LIKE :keyword_like
+            )
+            """,
+    "vin": " AND v.vehicle_identification_number = :vin",
+}
+
+
+@lru_cache(maxsize=128)
+def _build_search_query(
+    role: str, vehicle_status: str, filters: tuple, paged: bool = False
+):
+    """
+    Builds the vehicle search statement for one role, status and set of filters.
+
+    Only the shape of a search varies between calls, so the statement is cached on it
+    and repeat searches skip rebuilding and re-parsing the SQL.
+
+    Parameters:
+        role (str): User role performing the search.
+        vehicle_status (str): Vehicle status filter ("Sold", "Unsold"), or None.
+        filters (tuple): Names of the bound filter parameters present in the search.
+        paged (bool): Whether to add LIMIT :limit OFFSET :offset after the ORDER BY.
+
+    Returns:
+        TextClause: The search statement.
+    """
+    query = (
+        _search_projection(role)
+        + _SEARCH_VEHICLES_FROM
+        + _search_role_filter(role, vehicle_status)
+    )
+    if "year_like" in filters:
+        filters = tuple(name for name in filters if name != "keyword")
+    query += "".join(_SEARCH_FILTER_CLAUSES[name] for name in filters)
+    query += _SEARCH_VEHICLES_ORDER_BY
+    if paged:
+        query += "    LIMIT :limit OFFSET :offset\n"
+    return text(query)
+
+
+def _search_params(
     vehicle_type: str = None,
     manufacturer: str = None,
     year: int = None,
@@ -13,187 +427,135 @@ def search_vehicles(
     color: str = None,
     keyword: str = None,
     vin: str = None,
-    vehicle_status: str = None,
-    role: str = "Public",
-) -> pd.DataFrame:
+) -> dict:
     """
-    Searches vehicles based on the provided criteria using raw SQL.
+    Collects the bound parameters for the search filters that are set.
 
     Parameters:
-        vehicle_type (str, optional): The type of vehicle (e.g., Sedan, SUV).
-        manufacturer (str, optional): The vehicle manufacturer.
-        year (int, optional): The manufacturing year.
-        fuel_type (str, optional): The type of fuel used by the vehicle.
-        color (str, optional): The color of the vehicle.
-        keyword (str, optional): A keyword to search within the manufacturer, model, year, and description fields.
-        vin (str, optional): Specific vehicle identification number to search for.
-        vehicle_status (str, optional): Filter by vehicle status ("Sold", "Unsold").
-        role (str): User role performing the search (e.g., Public, Salesperson, Manager, etc.).
+        vehicle_type (str, optional): The type of vehicle, or "Any".
+        manufacturer (str, optional): The vehicle manufacturer, or "Any".
+        year (int, optional): The manufacturing year, or "Any".
+        fuel_type (str, optional): The type of fuel, or "Any".
+        color (str, optional): The color of the vehicle, or "Any".
+        keyword (str, optional): Free-text keyword entered by the user.
+        vin (str, optional): Specific vehicle identification number.
 
     Returns:
-        pd.DataFrame: DataFrame containing matching vehicle details, sorted by vehicle_identification_number.
+        dict: Parameter name -> value, one entry per filter clause to apply.
     """
-    query = """
-        SELECT 
-            v.vehicle_identification_number AS VIN,
-            v.vehicle_type AS VehicleType,
-            v.manufacturer_name AS Manufacturer,
-            v.model_name AS Model,
-            v.year AS Year,
-            v.fuel_type AS FuelType,
-            GROUP_CONCAT(DISTINCT vc.color_name SEPARATOR ', ') AS Colors,
-            v.horsepower AS Horsepower,
-            -- Calculate SalePrice dynamically using aggregated parts cost
-            CASE
-                WHEN st.sale_price IS NOT NULL THEN st.sale_price
-                ELSE ROUND((1.25 * pt.purchase_price) + (1.1 * IFNULL(po_aggregated.TotalPartsCost, 0)), 2)
-            END AS SalePrice,
-            pt.purchase_price AS PurchasePrice,
-            pt.purchased_on AS PurchaseDate,
-            ROUND(COALESCE(po_aggregated.TotalPartsCost, 0), 2) AS TotalPartsCost,
-            v.description AS Description
-        FROM Vehicle v
-        LEFT JOIN VehicleColor vc ON v.vehicle_identification_number = vc.vehicle_identification_number
-        LEFT JOIN SaleTransaction st ON v.vehicle_identification_number = st.vehicle_identification_number
-        LEFT JOIN PurchaseTransaction pt ON v.vehicle_identification_number = pt.vehicle_identification_number
-        -- Pre-aggregate PartsOrder costs by vehicle
-        LEFT JOIN (
-            SELECT 
-                vehicle_identification_number, 
-                SUM(total_cost) AS TotalPartsCost
-            FROM PartsOrder
-            GROUP BY vehicle_identification_number
-        ) po_aggregated ON v.vehicle_identification_number = po_aggregated.vehicle_identification_number
-    """
-
-    # Role-Based Filtering
-    if role in ["Public", "Salesperson"]:
-        query += """
-            WHERE st.sale_price IS NULL -- Unsold vehicles only
-            AND NOT EXISTS (
-                SELECT 1 FROM Part p
-                INNER JOIN PartsOrder po_sub ON p.order_number = po_sub.order_number
-                WHERE po_sub.vehicle_identification_number = v.vehicle_identification_number
-                  AND p.status != 'Installed'
-            ) -- No pending parts
-        """
-    elif role == "Inventory clerk":
-        query += "WHERE st.sale_price IS NULL"  # Show all unsold vehicles, with or without pending parts
-    elif role in ["Manager", "Owner"]:
-        if vehicle_status == "Sold":
-            query += "WHERE st.sale_price IS NOT NULL"  # Show only sold vehicles
-        elif vehicle_status == "Unsold":
-            query += "WHERE st.sale_price IS NULL"  # Show only unsold vehicles
-        else:
-            query += "WHERE 1=1"  # Show all vehicles (default for Managers and Owners)
-
-    # Parameters dictionary for dynamic filtering
     params = {}
 
     # Add filters dynamically based on input
     if vehicle_type and vehicle_type != "Any":
-        query += " AND v.vehicle_type = :vehicle_type"
         params["vehicle_type"] = vehicle_type
     if manufacturer and manufacturer != "Any":
-        query += " AND v.manufacturer_name = :manufacturer"
         params["manufacturer"] = manufacturer
     if year and year != "Any":
-        query += " AND v.year = :year"
         params["year"] = year
     if fuel_type and fuel_type != "Any":
-        query += " AND v.fuel_type = :fuel_type"
         params["fuel_type"] = fuel_type
     if color and color != "Any":
-        query += " AND vc.color_name = :color"
         params["color"] = color
     if keyword:
-        query += """
-            AND (
-                v.manufacturer_name LIKE :keyword OR
-                v.model_name LIKE :keyword OR
-                CAST(v.year AS CHAR) LIKE :keyword OR
-                v.description LIKE :keyword
-            )
-        """
-        params["keyword"] = f"%{keyword}%"
+        terms = _fulltext_terms(keyword)
+        if terms:
+            params["keyword"] = terms
+            if keyword.strip().isdigit():
+                params["year_like"] = f"%{keyword.strip()}%"
+        else:
+            # Nothing left for MATCH to search on; never drop the filter altogether
+            params["keyword_like"] = f"%{keyword}%"
     if vin:
-        query += " AND v.vehicle_identification_number = :vin"
         params["vin"] = vin
+    return params
 
-    query += """
-    GROUP BY 
-        v.vehicle_identification_number, 
-        v.vehicle_type, 
-        v.manufacturer_name, 
-        v.model_name, 
-        v.year, 
-        v.fuel_type, 
-        v.horsepower, 
-        st.sale_price,
-        pt.purchased_on, 
-        pt.purchase_price,
-        v.description
-    ORDER BY v.vehicle_identification_number ASC
+
+@st.cache_data(ttl=_READ_CACHE_TTL, show_spinner=False)
+def search_vehicles(
+    vehicle_type: str = None,
+    manufacturer: str = None,
+    year: int = None,
+    fuel_type: str = None,
+    color: str = None,
+    keyword: str = None,
+    vin: str = None,
+    vehicle_status: str = None,
+    role: str = "Public",
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> pd.DataFrame:
     """
+    Searches vehicles based on the provided criteria using raw SQL.
+
+    Parameters:
+        vehicle_type (str, optional): The type of vehicle (e.g., Sedan, SUV).
+        manufacturer (str, optional): The vehicle manufacturer.
+        year (int, optional): The manufacturing year.
+        fuel_type (str, optional): The type of fuel used by the vehicle.
+        color (str, optional): The color of the vehicle.
+        keyword (str, optional): A keyword to search within the manufacturer, model, year, and description fields.
+        vin (str, optional): Specific vehicle identification number to search for.
+        vehicle_status (str, optional): Filter by vehicle status ("Sold", "Unsold").
+        role (str): User role performing the search (e.g., Public, Salesperson, Manager, etc.).
+        limit (int, optional): Maximum number of vehicles to return; all matches when None.
+        offset (int): Number of matching vehicles to skip, in VIN order, when limit is set.
+
+    Returns:
+        pd.DataFrame: DataFrame containing the matching vehicle columns visible to the role,
+                      sorted by vehicle_identification_number.
+    """
+    # Parameters dictionary for dynamic filtering
+    params = _search_params(
+        vehicle_type, manufacturer, year, fuel_type, color, keyword, vin
+    )
+
+    query = _build_search_query(
+        role, vehicle_status, tuple(params), paged=limit is not None
+    )
+    if limit is not None:
+        params["limit"] = limit
+        params["offset"] = offset
 
     # Execute query and fetch results
     with create_session() as session:
-        results = session.execute(query, params).fetchall()
-
-    # Convert results to DataFrame
-    df = pd.DataFrame(
-        results,
-        columns=[
-            "VIN",
-            "VehicleType",
-            "Manufacturer",
-            "Model",
-            "Year",
-            "FuelType",
-            "Colors",
-            "Horsepower",
-            "SalePrice",
-            "PurchasePrice",
-            "PurchaseDate",
-            "TotalPartsCost",
-            "Description",
-        ],
-    )
+        df = _read_frame(session, query, params)
 
-    # Adjust columns based on role
-    if role == "Public" or role == "Salesperson":
-        return df[
-            [
-                "VIN",
-                "VehicleType",
-                "Manufacturer",
-                "Model",
-                "Year",
-                "FuelType",
-                "Colors",
-                "Horsepower",
-                "SalePrice",
-            ]
-        ]
-    elif role == "Inventory clerk":
-        return df[
-            [
-                "VIN",
-                "VehicleType",
-                "Manufacturer",
-                "Model",
-                "Year",
-                "FuelType",
-                "Colors",
-                "Horsepower",
-                "PurchasePrice",
-                "TotalPartsCost",
-            ]
-        ]
-    elif role in ["Manager", "Owner"]:
-        return df
+        columns = _search_columns(role)
+        if "Colors" in columns:
+            _attach_colors(session, df, columns.index("Colors"))
 
-    return df
+    if "SalePrice" in df:
+        _apply_list_price(df)
+
+    return _to_arrow(df)
+
+
+# Unsold vehicles split into available for sale and waiting on parts, in one pass
+_VEHICLE_COUNTS_QUERY = text(
+    f"""
+    SELECT
+        SUM(CASE WHEN pending.vehicle_identification_number IS NULL THEN 1 ELSE 0 END) AS Available,
+        SUM(CASE WHEN pending.vehicle_identification_number IS NOT NULL THEN 1 ELSE 0 END) AS PendingParts
+    FROM Vehicle v
+    LEFT JOIN ({_PENDING_PARTS_VINS}) pending
+        ON pending.vehicle_identification_number = v.vehicle_identification_number
+    LEFT JOIN SaleTransaction st ON v.vehicle_identification_number = st.vehicle_identification_number
+    WHERE st.vehicle_identification_number IS NULL -- Exclude sold vehicles
+"""
+)
+
+
+@st.cache_data(ttl=_READ_CACHE_TTL, show_spinner=False)
+def count_available_and_pending() -> tuple:
+    """
+    Counts unsold vehicles available for sale and those with parts pending, using one query.
+
+    Returns:
+        tuple: Count of vehicles available for sale and count of vehicles with parts pending.
+    """
+    with create_session() as session:
+        available, pending = session.execute(_VEHICLE_COUNTS_QUERY).fetchone()
+    return int(available or 0), int(pending or 0)
 
 
 def count_cars_with_pending_parts() -> int:
@@ -203,23 +565,7 @@ def count_cars_with_pending_parts() -> int:
     Returns:
         int: Count of vehicles with parts pending.
     """
-    query = """
-        SELECT COUNT(DISTINCT v.vehicle_identification_number) AS pending_parts_count
-        FROM Vehicle v
-        INNER JOIN PartsOrder po ON v.vehicle_identification_number = po.vehicle_identification_number
-        INNER JOIN Part p ON po.order_number = p.order_number
-        WHERE p.status != 'Installed' -- Parts not yet installed
-        AND v.vehicle_identification_number NOT IN (
-            SELECT vehicle_identification_number 
-            FROM SaleTransaction
-        ) -- Exclude sold vehicles
-    """
-
-    with create_session() as session:
-        result = session.execute(query).fetchone()
-
-    pending_count = result["pending_parts_count"] if result else 0
-    return pending_count
+    return count_available_and_pending()[1]
 
 
 def count_available_cars() -> int:
@@ -229,28 +575,47 @@ def count_available_cars() -> int:
     Returns:
         int: Count of vehicles available for sale.
     """
-    query = """
-        SELECT COUNT(DISTINCT v.vehicle_identification_number) AS available_for_sale
-        FROM Vehicle v
-        LEFT JOIN PartsOrder po ON v.vehicle_identification_number = po.vehicle_identification_number
-        WHERE NOT EXISTS (
-            SELECT 1 
-            FROM Part p
-            INNER JOIN PartsOrder po_sub ON p.order_number = po_sub.order_number
-            WHERE po_sub.vehicle_identification_number = v.vehicle_identification_number
-              AND p.status != 'Installed'
-        ) -- Ensure no pending parts
-        AND v.vehicle_identification_number NOT IN (
-            SELECT vehicle_identification_number 
-            FROM SaleTransaction
-        ) -- Ensure vehicle is not sold
-    """
-
-    with create_session() as session:
-        result = session.execute(query).fetchone()
-        return result["available_for_sale"] if result else 0
+    return count_available_and_pending()[0]
 
 
+# SQL query to fetch seller history report data
+_SELLER_HISTORY_QUERY = text(
+    """
+    -- Parts quantity and cost per vehicle, aggregated once
+    WITH parts_per_vin AS (
+        SELECT 
+            po.vehicle_identification_number,
+            SUM(p.quantity) AS parts_quantity,
+            SUM(p.quantity * p.unit_price) AS parts_cost
+        FROM Part p
+        INNER JOIN PartsOrder po ON po.order_number = p.order_number
+        GROUP BY po.vehicle_identification_number
+    )
+    SELECT 
+        CASE 
+            WHEN bc.business_name IS NOT NULL THEN bc.business_name
+            ELSE CONCAT(ic.first_name, ' ', ic.last_name)
+        END AS SellerName,
+
+        COUNT(pt.vehicle_identification_number) AS TotalVehiclesSold,
+        ROUND(AVG(pt.purchase_price), 2) AS AvgPurchasePrice,
+        AVG(COALESCE(ppv.parts_quantity, 0)) AS AvgPartsQuantityPerVehicle,
+        AVG(COALESCE(ppv.parts_cost, 0)) AS AvgPartsCostPerVehicle
+
+    FROM PurchaseTransaction pt
+    LEFT JOIN parts_per_vin ppv ON ppv.vehicle_identification_number = pt.vehicle_identification_number
+    LEFT JOIN BusinessCustomer bc ON pt.customer_id = bc.customer_id
+    LEFT JOIN IndividualCustomer ic ON pt.customer_id = ic.customer_id
+
+    GROUP BY pt.customer_id
+    ORDER BY 
+        TotalVehiclesSold DESC, 
+        AvgPurchasePrice ASC;
+"""
+)
+
+
+@st.cache_data(ttl=_READ_CACHE_TTL, show_spinner=False)
 def seller_history_report() -> pd.DataFrame:
     """
     Generates the Seller History Report, showing details for each seller,
@@ -260,44 +625,9 @@ def seller_history_report() -> pd.DataFrame:
     Returns:
         pd.DataFrame: DataFrame containing the seller history report, with a flag for highlighting rows.
     """
-    # SQL query to fetch seller history report data
-    query = """
-        SELECT 
-            CASE 
-                WHEN bc.business_name IS NOT NULL THEN bc.business_name
-                ELSE CONCAT(ic.first_name, ' ', ic.last_name)
-            END AS SellerName,
-            
-            COUNT(pt.vehicle_identification_number) AS TotalVehiclesSold,
-            ROUND(AVG(pt.purchase_price), 2) AS AvgPurchasePrice,
-            
-            AVG(
-                (SELECT COALESCE(SUM(p.quantity), 0) 
-                 FROM Part p 
-                 INNER JOIN PartsOrder po ON po.order_number = p.order_number 
-                 WHERE po.vehicle_identification_number = pt.vehicle_identification_number)
-            ) AS AvgPartsQuantityPerVehicle,
-            
-            AVG(
-                (SELECT COALESCE(SUM(p.quantity * p.unit_price), 0) 
-                 FROM Part p 
-                 INNER JOIN PartsOrder po ON po.order_number = p.order_number 
-                 WHERE po.vehicle_identification_number = pt.vehicle_identification_number)
-            ) AS AvgPartsCostPerVehicle
-
-        FROM PurchaseTransaction pt
-        LEFT JOIN BusinessCustomer bc ON pt.customer_id = bc.customer_id
-        LEFT JOIN IndividualCustomer ic ON pt.customer_id = ic.customer_id
-
-        GROUP BY pt.customer_id
-        ORDER BY 
-            TotalVehiclesSold DESC, 
-            AvgPurchasePrice ASC;
-    """
-
     # Execute query and fetch data
     with create_session() as session:
-        result = session.execute(query).fetchall()
+        result = _fetch_raw(session, _SELLER_HISTORY_QUERY)
 
     # Convert the result to a DataFrame
     columns = [
@@ -309,9 +639,29 @@ def seller_history_report() -> pd.DataFrame:
     ]
     df = pd.DataFrame(result, columns=columns)
 
-    return df
+    return _to_arrow(df)
 
 
+_AVERAGE_INVENTORY_TIME_QUERY = text(
+    """
+    SELECT 
+        vt.vehicle_type AS VehicleType,
+        CASE 
+            WHEN COUNT(st.sold_on) = 0 THEN 'N/A' 
+            ELSE ROUND(AVG(DATEDIFF(st.sold_on, pt.purchased_on) + 1), 2) 
+        END AS AvgInventoryTime
+    FROM Vehicle v
+    JOIN VehicleType vt ON v.vehicle_type = vt.vehicle_type
+    LEFT JOIN PurchaseTransaction pt ON v.vehicle_identification_number = pt.vehicle_identification_number
+    LEFT JOIN SaleTransaction st ON v.vehicle_identification_number = st.vehicle_identification_number
+    # WHERE st.sold_on >= pt.purchased_on  -- Ensure sold_on is after or on purchased_on
+    GROUP BY vt.vehicle_type
+    ORDER BY vt.vehicle_type ASC;
+"""
+)
+
+
+@st.cache_data(ttl=_READ_CACHE_TTL, show_spinner=False)
 def average_inventory_time_report() -> pd.DataFrame:
     """
     Generates the Average Inventory Time (AVT) report based on vehicle type.
@@ -319,24 +669,8 @@ def average_inventory_time_report() -> pd.DataFrame:
     Returns:
         pd.DataFrame: DataFrame containing the average inventory time for each vehicle type.
     """
-    query = """
-        SELECT 
-            vt.vehicle_type AS VehicleType,
-            CASE 
-                WHEN COUNT(st.sold_on) = 0 THEN 'N/A' 
-                ELSE ROUND(AVG(DATEDIFF(st.sold_on, pt.purchased_on) + 1), 2) 
-            END AS AvgInventoryTime
-        FROM Vehicle v
-        JOIN VehicleType vt ON v.vehicle_type = vt.vehicle_type
-        LEFT JOIN PurchaseTransaction pt ON v.vehicle_identification_number = pt.vehicle_identification_number
-        LEFT JOIN SaleTransaction st ON v.vehicle_identification_number = st.vehicle_identification_number
-        # WHERE st.sold_on >= pt.purchased_on  -- Ensure sold_on is after or on purchased_on
-        GROUP BY vt.vehicle_type
-        ORDER BY vt.vehicle_type ASC;
-    """
-
     with create_session() as session:
-        result = session.execute(query).fetchall()
+        result = session.execute(_AVERAGE_INVENTORY_TIME_QUERY).fetchall()
 
     # Define column names based on query results
     columns = ["Vehicle Type", "Avg Inventory Time"]
@@ -345,6 +679,22 @@ def average_inventory_time_report() -> pd.DataFrame:
     return df
 
 
+# SQL query to fetch each vehicle's type, condition and purchase price for pivoting
+_PRICE_PER_CONDITION_QUERY = text(
+    """
+    SELECT 
+        v.vehicle_type AS VehicleType,
+        v.condition AS VehicleCondition,
+        pt.purchase_price AS PurchasePrice
+    FROM Vehicle v
+    LEFT JOIN PurchaseTransaction pt ON v.vehicle_identification_number = pt.vehicle_identification_number
+"""
+)
+
+_VEHICLE_CONDITIONS = ["Excellent", "Very Good", "Good", "Fair"]
+
+
+@st.cache_data(ttl=_READ_CACHE_TTL, show_spinner=False)
 def price_per_condition_report():
     """
     Generates a Price per Condition (PPC) Report, displaying the average purchase price
@@ -354,31 +704,49 @@ def price_per_condition_report():
         pd.DataFrame: A DataFrame containing the average purchase price per condition
                       for each vehicle type. Entries with no purchase records show $0.
     """
-    # SQL query to calculate average purchase price per vehicle type and condition
-    query = """
-        SELECT 
-            v.vehicle_type AS VehicleType,
-            COALESCE(AVG(CASE WHEN v.condition = 'Excellent' THEN pt.purchase_price END), 0) AS Excellent,
-            COALESCE(AVG(CASE WHEN v.condition = 'Very Good' THEN pt.purchase_price END), 0) AS VeryGood,
-            COALESCE(AVG(CASE WHEN v.condition = 'Good' THEN pt.purchase_price END), 0) AS Good,
-            COALESCE(AVG(CASE WHEN v.condition = 'Fair' THEN pt.purchase_price END), 0) AS Fair
-        FROM Vehicle v
-        LEFT JOIN PurchaseTransaction pt ON v.vehicle_identification_number = pt.vehicle_identification_number
-        GROUP BY v.vehicle_type
-        ORDER BY v.vehicle_type ASC;
-    """
-
-    # Execute query and fetch results
     with create_session() as session:
-        result = session.execute(text(query)).fetchall()
-
-    # Convert results to DataFrame with specified columns
-    columns = ["Vehicle Type", "Excellent", "Very Good", "Good", "Fair"]
-    df = pd.DataFrame(result, columns=columns)
+        prices = _read_frame(session, _PRICE_PER_CONDITION_QUERY)
+
+    # Pivot to one row per vehicle type and one column per condition. The type and
+    # condition repeat on every row, so group on categorical codes instead of strings
+    prices["PurchasePrice"] = pd.to_numeric(prices["PurchasePrice"])
+    prices = prices.astype(
+        {
+            "VehicleType": "category",
+            "VehicleCondition": pd.CategoricalDtype(_VEHICLE_CONDITIONS),
+        }
+    )
+    df = (
+        prices.groupby(["VehicleType", "VehicleCondition"], observed=True)[
+            "PurchasePrice"
+        ]
+        .mean()
+        .unstack()
+        .reindex(columns=_VEHICLE_CONDITIONS)
+        .fillna(0)
+        .rename_axis(index="Vehicle Type", columns=None)
+        .reset_index()
+    )
 
     return df
 
 
+_PARTS_STATISTICS_QUERY = text(
+    """
+    SELECT 
+        v.name AS VendorName,
+        SUM(p.quantity) AS TotalPartsQuantity,
+        SUM(p.unit_price * p.quantity) AS TotalAmountSpent
+    FROM Vendor v
+    JOIN PartsOrder po ON v.name = po.name
+    JOIN Part p ON po.order_number = p.order_number
+    GROUP BY v.name
+    ORDER BY TotalAmountSpent DESC
+"""
+)
+
+
+@st.cache_data(ttl=_READ_CACHE_TTL, show_spinner=False)
 def parts_statistics_report() -> pd.DataFrame:
     """
     Generates the Parts Statistics Report to assist North Avenue Automotive in analyzing parts expenses by vendor.
@@ -387,28 +755,35 @@ def parts_statistics_report() -> pd.DataFrame:
         pd.DataFrame: A DataFrame containing vendor names, total parts quantity, and total dollar amount spent on parts,
                       sorted by total dollar amount spent in descending order.
     """
-    query = """
-        SELECT 
-            v.name AS VendorName,
-            SUM(p.quantity) AS TotalPartsQuantity,
-            SUM(p.unit_price * p.quantity) AS TotalAmountSpent
-        FROM Vendor v
-        JOIN PartsOrder po ON v.name = po.name
-        JOIN Part p ON po.order_number = p.order_number
-        GROUP BY v.name
-        ORDER BY TotalAmountSpent DESC
-    """
-
     with create_session() as session:
-        result = session.execute(query).fetchall()
+        result = session.execute(_PARTS_STATISTICS_QUERY).fetchall()
 
     # Define column names based on the query output
     columns = ["Vendor Name", "Total Parts Quantity", "Total Amount Spent"]
     df = pd.DataFrame(result, columns=columns)
 
-    return df
+    return _to_arrow(df)
 
 
+_MONTHLY_SALES_SUMMARY_QUERY = text(
+    """
+    SELECT 
+        YEAR(st.sold_on) AS Year,
+        MONTH(st.sold_on) AS Month,
+        COUNT(st.vehicle_identification_number) AS VehiclesSold,
+        SUM(st.sale_price) AS GrossSalesIncome,
+        SUM(st.sale_price - pt.purchase_price - IFNULL(vpc.total_parts_cost, 0)) AS NetIncome
+    FROM SaleTransaction st
+    JOIN PurchaseTransaction pt ON st.vehicle_identification_number = pt.vehicle_identification_number
+    LEFT JOIN VehiclePartsCost vpc ON st.vehicle_identification_number = vpc.vehicle_identification_number
+    GROUP BY Year, Month
+    HAVING VehiclesSold > 0
+    ORDER BY Year DESC, Month DESC;
+"""
+)
+
+
+@st.cache_data(ttl=_READ_CACHE_TTL, show_spinner=False)
 def monthly_sales_summary() -> pd.DataFrame:
     """
     Generates a monthly summary of sales transactions, showing total vehicles sold,
@@ -417,36 +792,32 @@ def monthly_sales_summary() -> pd.DataFrame:
     Returns:
         pd.DataFrame: A DataFrame containing the monthly sales summary.
     """
-    query = """
-        SELECT 
-            YEAR(st.sold_on) AS Year,
-            MONTH(st.sold_on) AS Month,
-            COUNT(st.vehicle_identification_number) AS VehiclesSold,
-            SUM(st.sale_price) AS GrossSalesIncome,
-            SUM(st.sale_price - pt.purchase_price - IFNULL(po.total_cost, 0)) AS NetIncome
-        FROM SaleTransaction st
-        JOIN PurchaseTransaction pt ON st.vehicle_identification_number = pt.vehicle_identification_number
-        LEFT JOIN (
-            SELECT 
-                po.vehicle_identification_number, 
-                SUM(po.total_cost) AS total_cost
-            FROM PartsOrder po
-            GROUP BY po.vehicle_identification_number
-        ) po ON st.vehicle_identification_number = po.vehicle_identification_number
-        GROUP BY Year, Month
-        HAVING VehiclesSold > 0
-        ORDER BY Year DESC, Month DESC;
-    """
-
     with create_session() as session:
-        result = session.execute(query).fetchall()
+        result = _fetch_raw(session, _MONTHLY_SALES_SUMMARY_QUERY)
 
     columns = ["Year", "Month", "Vehicles Sold", "Gross Sales Income", "Net Income"]
     df = pd.DataFrame(result, columns=columns)
 
-    return df
+    return _to_arrow(df)
 
 
+_MONTHLY_SALES_DRILLDOWN_QUERY = text(
+    """
+    SELECT 
+        u.first_name AS SalespersonFirstName,
+        u.last_name AS SalespersonLastName,
+        COUNT(st.vehicle_identification_number) AS VehiclesSold,
+        SUM(st.sale_price) AS TotalSales
+    FROM SaleTransaction st
+    JOIN User u ON st.username = u.username
+    WHERE   YEAR(st.sold_on) = :year AND MONTH(st.sold_on) = :month
+    GROUP BY u.username
+    ORDER BY VehiclesSold DESC, TotalSales DESC;
+"""
+)
+
+
+@st.cache_data(ttl=_READ_CACHE_TTL, show_spinner=False)
 def monthly_sales_drilldown(year: str, month: str) -> pd.DataFrame:
     """
     Generates a drilldown report of top-performing salespeople for a specified month and year.
@@ -458,29 +829,20 @@ def monthly_sales_drilldown(year: str, month: str) -> pd.DataFrame:
     Returns:
         pd.DataFrame: A DataFrame containing the monthly sales drilldown by salesperson.
     """
-    query = """
-        SELECT 
-            u.first_name AS SalespersonFirstName,
-            u.last_name AS SalespersonLastName,
-            COUNT(st.vehicle_identification_number) AS VehiclesSold,
-            SUM(st.sale_price) AS TotalSales
-        FROM SaleTransaction st
-        JOIN User u ON st.username = u.username
-        WHERE   YEAR(st.sold_on) = :year AND MONTH(st.sold_on) = :month
-        GROUP BY u.username
-        ORDER BY VehiclesSold DESC, TotalSales DESC;
-    """
-
     params = {"year": year, "month": month}
 
     with create_session() as session:
-        result = session.execute(query, params).fetchall()
+        result = session.execute(_MONTHLY_SALES_DRILLDOWN_QUERY, params).fetchall()
 
     columns = ["First Name", "Last Name", "Vehicles Sold", "Total Sales"]
     df = pd.DataFrame(result, columns=columns)
-    return df
+    return _to_arrow(df)
+
 
+_VENDOR_NAMES_QUERY = text("SELECT name FROM Vendor ORDER BY name")
 
+
+@st.cache_data(ttl=_LOOKUP_CACHE_TTL, show_spinner=False)
 def fetch_vendors():
     """
     Fetches vendor names from the database using raw SQL.
@@ -488,12 +850,59 @@ def fetch_vendors():
     Returns:
         list: A list of vendor names.
     """
-    query = "SELECT name FROM Vendor"
     with create_session() as session:
-        vendors = session.execute(query).fetchall()
+        vendors = session.execute(_VENDOR_NAMES_QUERY).fetchall()
     return [vendor[0] for vendor in vendors]
 
 
+# Insert the order with the VIN's next sequential order number computed in MySQL;
+# padded to at least three digits and widened past 999 so numbers stay unique
+_INSERT_PARTS_ORDER_QUERY = text(
+    """
+    INSERT INTO PartsOrder (vehicle_identification_number, name, order_number, total_cost)
+    SELECT
+        :vin,
+        :vendor_name,
+        CONCAT(:vin, '-', LPAD(next_order.n, GREATEST(3, CHAR_LENGTH(next_order.n)), '0')),
+        :total_cost
+    FROM (
+        SELECT COALESCE(MAX(CAST(SUBSTRING_INDEX(order_number, '-', -1) AS UNSIGNED)), 0) + 1 AS n
+        FROM PartsOrder
+        WHERE vehicle_identification_number = :vin
+    ) next_order
+"""
+)
+
+# The order number generated above, read back inside the same transaction
+_LATEST_ORDER_NUMBER_QUERY = text(
+    """
+    SELECT order_number
+    FROM PartsOrder
+    WHERE vehicle_identification_number = :vin
+    ORDER BY CAST(SUBSTRING_INDEX(order_number, '-', -1) AS UNSIGNED) DESC
+    LIMIT 1
+"""
+)
+
+
+# Add the order's cost to the vehicle's running parts total
+_ADD_VEHICLE_PARTS_COST_QUERY = text(
+    """
+    INSERT INTO VehiclePartsCost (vehicle_identification_number, total_parts_cost)
+    VALUES (:vin, :total_cost)
+    ON DUPLICATE KEY UPDATE total_parts_cost = total_parts_cost + VALUES(total_parts_cost)
+"""
+)
+
+
+_INSERT_PART_QUERY = text(
+    """
+    INSERT INTO Part (order_number, vendor_parts_number, description, quantity, status, unit_price)
+    VALUES (:order_number, :vendor_part_number, :description, :quantity, :status, :unit_price)
+"""
+)
+
+
 def add_parts_order(vin: str, vendor_name: str, parts: list) -> bool:
     """
     Adds a parts order for a specific vehicle, including multiple parts.
@@ -508,58 +917,58 @@ def add_parts_order(vin: str, vendor_name: str, parts: list) -> bool:
     """
     try:
         with create_session() as session:
-            # Step 1: Generate a new `order_number` for the VIN
-            query = "SELECT COUNT(*) FROM PartsOrder WHERE vehicle_identification_number = :vin"
-            count = session.execute(query, {"vin": vin}).scalar()
-            sequential_number = count + 1
-            order_number = f"{vin}-{str(sequential_number).zfill(3)}"
-
-            # Step 2: Calculate the total cost of all parts
+            # Step 1: Calculate the total cost of all parts
             total_cost = round(
                 sum(part["unit_price"] * part["quantity"] for part in parts), 2
             )
 
-            # Step 3: Insert the order into `PartsOrder`
-            parts_order_query = """
-                INSERT INTO PartsOrder (vehicle_identification_number, name, order_number, total_cost)
-                VALUES (:vin, :vendor_name, :order_number, :total_cost)
-            """
+            # Step 2: Insert the order into `PartsOrder`, numbering it atomically
             session.execute(
-                parts_order_query,
-                {
-                    "vin": vin,
-                    "vendor_name": vendor_name,
-                    "order_number": order_number,
-                    "total_cost": total_cost,
-                },
+                _INSERT_PARTS_ORDER_QUERY,
+                {"vin": vin, "vendor_name": vendor_name, "total_cost": total_cost},
+            )
+            order_number = session.execute(
+                _LATEST_ORDER_NUMBER_QUERY, {"vin": vin}
+            ).scalar()
+            session.execute(
+                _ADD_VEHICLE_PARTS_COST_QUERY, {"vin": vin, "total_cost": total_cost}
             )
 
-            # Step 4: Insert each part into the `Part` table
-            for part in parts:
-                part_query = """
-                    INSERT INTO Part (order_number, vendor_parts_number, description, quantity, status, unit_price)
-                    VALUES (:order_number, :vendor_part_number, :description, :quantity, :status, :unit_price)
-                """
+            # Step 3: Insert all parts into the `Part` table in one executemany
+            if parts:
                 session.execute(
-                    part_query,
-                    {
-                        "order_number": order_number,
-                        "vendor_part_number": part["vendor_part_number"],
-                        "description": part["part_description"],
-                        "quantity": part["quantity"],
-                        "status": part["part_status"],
-                        "unit_price": part["unit_price"],
-                    },
+                    _INSERT_PART_QUERY,
+                    [
+                        {
+                            "order_number": order_number,
+                            "vendor_part_number": part["vendor_part_number"],
+                            "description": part["part_description"],
+                            "quantity": part["quantity"],
+                            "status": part["part_status"],
+                            "unit_price": part["unit_price"],
+                        }
+                        for part in parts
+                    ],
                 )
 
             # Commit the transaction
             session.commit()
+            _clear_read_caches()
             return True
     except Exception as e:
         print(f"Error adding parts order: {e}")
         return False
 
 
+# SQL query to insert a new vendor
+_INSERT_VENDOR_QUERY = text(
+    """
+    INSERT INTO Vendor (name, phone_number, address_street, address_city, address_state, address_postal_code)
+    VALUES (:name, :phone_number, :address_street, :address_city, :address_state, :address_postal_code)
+"""
+)
+
+
 def add_vendor(
     name: str,
     phone_number: str,
@@ -582,16 +991,10 @@ def add_vendor(
     Returns:
         bool: True if the vendor was added successfully, False otherwise.
     """
-    # SQL query to insert a new vendor
-    query = """
-        INSERT INTO Vendor (name, phone_number, address_street, address_city, address_state, address_postal_code)
-        VALUES (:name, :phone_number, :address_street, :address_city, :address_state, :address_postal_code)
-    """
-
     try:
         with create_session() as session:
             session.execute(
-                query,
+                _INSERT_VENDOR_QUERY,
                 {
                     "name": name,
                     "phone_number": phone_number,
@@ -602,6 +1005,7 @@ def add_vendor(
                 },
             )
             session.commit()  # Commit the transaction
+            _clear_read_caches()
             return True
     except Exception as e:
         # Handle exceptions (you can log this error or print it)
@@ -609,6 +1013,45 @@ def add_vendor(
         return False
 
 
+_INSERT_VEHICLE_QUERY = text(
+    """
+    INSERT INTO Vehicle (vehicle_identification_number, vehicle_type, manufacturer_name, `condition`, model_name, `year`, fuel_type, horsepower, description)
+    VALUES (:vin, :vehicle_type, :manufacturer, :condition, :model, :year, :fuel_type, :horsepower, :description)
+"""
+)
+
+
+def _add_vehicle(
+    session,
+    vin,
+    vehicle_type,
+    manufacturer,
+    condition,
+    model,
+    year,
+    fuel_type,
+    horsepower,
+    description="",
+):
+    """
+    Inserts a vehicle row in the caller's transaction, without committing.
+    """
+    session.execute(
+        _INSERT_VEHICLE_QUERY,
+        {
+            "vin": vin,
+            "vehicle_type": vehicle_type,
+            "manufacturer": manufacturer,
+            "condition": condition,
+            "model": model,
+            "year": year,
+            "fuel_type": fuel_type,
+            "horsepower": horsepower,
+            "description": description,
+        },
+    )
+
+
 def add_vehicle(
     customer_id,
     vin,
@@ -651,31 +1094,26 @@ def add_vehicle(
     Returns:
         bool: True if the vehicle and customer were added successfully, False otherwise.
     """
+    if customer_id is None:
+        return False
+
     with create_session() as session:
         # Insert vehicle data
         try:
-            session.execute(
-                """
-                INSERT INTO Vehicle (vehicle_identification_number, vehicle_type, manufacturer_name, `condition`, model_name, `year`, fuel_type, horsepower, description)
-                VALUES (:vin, :vehicle_type, :manufacturer, :condition, :model, :year, :fuel_type, :horsepower, :description)
-                """,
-                {
-                    "vin": vin,
-                    "vehicle_type": vehicle_type,
-                    "manufacturer": manufacturer,
-                    "condition": condition,
-                    "model": model,
-                    "year": year,
-                    "fuel_type": fuel_type,
-                    "horsepower": horsepower,
-                    "description": description,
-                },
+            _add_vehicle(
+                session,
+                vin,
+                vehicle_type,
+                manufacturer,
+                condition,
+                model,
+                year,
+                fuel_type,
+                horsepower,
+                description,
             )
-
-            if customer_id is None:
-                return False
-
             session.commit()
+            _clear_read_caches()
             return True
         except Exception as e:
             session.rollback()
@@ -683,6 +1121,16 @@ def add_vehicle(
             return False
 
 
+# SQL query to select customer identifiers (SSN or Tax ID); the two sets never overlap
+_CUSTOMER_IDENTIFIERS_QUERY = text(
+    """
+    SELECT social_security_number AS SSN FROM IndividualCustomer WHERE social_security_number IS NOT NULL
+    UNION ALL SELECT tax_identification_number AS TaxID FROM BusinessCustomer WHERE tax_identification_number IS NOT NULL
+"""
+)
+
+
+@st.cache_data(ttl=_LOOKUP_CACHE_TTL, show_spinner=False)
 def lookup_customers():
     """
     Looks up customer names from the Customer table.
@@ -691,11 +1139,7 @@ def lookup_customers():
         List[str]: A list of customer names.
     """
     with create_session() as session:
-        # SQL query to select customer names
-        query = "SELECT social_security_number AS SSN FROM IndividualCustomer WHERE social_security_number IS NOT NULL"
-        query += " UNION SELECT tax_identification_number AS TaxID FROM BusinessCustomer WHERE tax_identification_number IS NOT NULL"
-
-        results = session.execute(query).fetchall()
+        results = _fetch_raw(session, _CUSTOMER_IDENTIFIERS_QUERY)
 
     # Extracting full names into a list
     customer_names = [result[0] for result in results]
@@ -703,6 +1147,30 @@ def lookup_customers():
     return customer_names
 
 
+_INSERT_CUSTOMER_QUERY = text(
+    """
+    INSERT INTO Customer (email, phone_number, address_street, address_city, address_state, address_postal_code)
+    VALUES (:email, :phone, :street, :city, :state, :postal_code)
+"""
+)
+
+
+_INSERT_INDIVIDUAL_CUSTOMER_QUERY = text(
+    """
+    INSERT INTO IndividualCustomer (customer_id, first_name, last_name, social_security_number)
+    VALUES (:customer_id, :first_name, :last_name, :ssn)
+"""
+)
+
+
+_INSERT_BUSINESS_CUSTOMER_QUERY = text(
+    """
+    INSERT INTO BusinessCustomer (customer_id, business_name, tax_identification_number, primary_contact_first_name, primary_contact_last_name, primary_contact_title)
+    VALUES (:customer_id, :business_name, :tax_id, :primary_contact_first_name, :primary_contact_last_name, :primary_contact_title)
+"""
+)
+
+
 def add_customer(
     customer_type,
     first_name,
@@ -744,11 +1212,8 @@ def add_customer(
     with create_session() as session:
         try:
             # Insert customer data into the generic Customer table
-            session.execute(
-                """
-                INSERT INTO Customer (email, phone_number, address_street, address_city, address_state, address_postal_code)
-                VALUES (:email, :phone, :street, :city, :state, :postal_code)
-                """,
+            result = session.execute(
+                _INSERT_CUSTOMER_QUERY,
                 {
                     "email": email,
                     "phone": phone,
@@ -759,16 +1224,14 @@ def add_customer(
                 },
             )
 
-            # Fetch the customer ID of the newly inserted customer
-            customer_id = session.execute("SELECT LAST_INSERT_ID()").scalar()
+            # The driver reports the new auto-increment ID with the INSERT's
+            # reply, so no separate LAST_INSERT_ID() round trip is needed
+            customer_id = result.lastrowid
 
             # Insert into specific customer table based on customer type
             if customer_type == "Individual":
                 session.execute(
-                    """
-                    INSERT INTO IndividualCustomer (customer_id, first_name, last_name, social_security_number)
-                    VALUES (:customer_id, :first_name, :last_name, :ssn)
-                    """,
+                    _INSERT_INDIVIDUAL_CUSTOMER_QUERY,
                     {
                         "customer_id": customer_id,
                         "first_name": first_name,
@@ -778,10 +1241,7 @@ def add_customer(
                 )
             elif customer_type == "Business":
                 session.execute(
-                    """
-                    INSERT INTO BusinessCustomer (customer_id, business_name, tax_identification_number, primary_contact_first_name, primary_contact_last_name, primary_contact_title)
-                    VALUES (:customer_id, :business_name, :tax_id, :primary_contact_first_name, :primary_contact_last_name, :primary_contact_title)
-                    """,
+                    _INSERT_BUSINESS_CUSTOMER_QUERY,
                     {
                         "customer_id": customer_id,
                         "business_name": business_name,
@@ -792,6 +1252,8 @@ def add_customer(
                     },
                 )
             session.commit()
+            fetch_customer_id.clear()
+            lookup_customers.clear()
             return customer_id  # Return the ID of the newly created customer
         except Exception as e:
             session.rollback()
@@ -799,24 +1261,56 @@ def add_customer(
             return None  # Return None on failure
 
 
+# SQL query to select the customer ID for an SSN or Tax ID
+_CUSTOMER_ID_QUERY = text(
+    """
+    SELECT customer_id FROM IndividualCustomer WHERE social_security_number = :customer
+    UNION SELECT customer_id FROM BusinessCustomer WHERE tax_identification_number = :customer
+"""
+)
+
+
+@st.cache_data(ttl=_READ_CACHE_TTL, show_spinner=False)
 def fetch_customer_id(customer):
     """
-    Looks up customer names from the Customer table.
+    Looks up the customer ID for an SSN or Tax ID.
+
+    Parameters:
+        customer (str): SSN or Tax ID of the customer.
 
     Returns:
-        List[str]: A list of customer names.
+        tuple: The matching customer IDs.
     """
     with create_session() as session:
-        # SQL query to select customer names
-        query = "SELECT customer_id FROM IndividualCustomer WHERE social_security_number = :customer"
-        query += " UNION SELECT customer_id FROM BusinessCustomer WHERE tax_identification_number = :customer"
+        results = session.execute(_CUSTOMER_ID_QUERY, {"customer": customer}).fetchall()
 
-        results = session.execute(query, {"customer": customer}).fetchall()
+    return tuple(result[0] for result in results)
 
-    # Extracting full names into a list
-    customer_ids = [result[0] for result in results]
 
-    return customer_ids
+_INSERT_PURCHASE_TRANSACTION_QUERY = text(
+    """
+    INSERT INTO PurchaseTransaction (vehicle_identification_number, customer_id, username, purchase_price, purchased_on)
+    VALUES (:vin, :customer_id, :username, :purchase_price, :purchase_date)
+"""
+)
+
+
+def _add_purchase_transaction(
+    session, vin, customer_id, username, purchase_price, purchase_date
+):
+    """
+    Inserts a purchase transaction row in the caller's transaction, without committing.
+    """
+    session.execute(
+        _INSERT_PURCHASE_TRANSACTION_QUERY,
+        {
+            "vin": vin,
+            "customer_id": customer_id,
+            "username": username,
+            "purchase_price": purchase_price,
+            "purchase_date": purchase_date,
+        },
+    )
 
 
 def add_purchase_transaction(vin, customer_id, username, purchase_price, purchase_date):
@@ -835,20 +1329,11 @@ def add_purchase_transaction(vin, customer_id, username, purchase_price, purchas
     """
     with create_session() as session:
         try:
-            session.execute(
-                """
-                INSERT INTO PurchaseTransaction (vehicle_identification_number, customer_id, username, purchase_price, purchased_on)
-                VALUES (:vin, :customer_id, :username, :purchase_price, :purchase_date)
-                """,
-                {
-                    "vin": vin,
-                    "customer_id": customer_id,
-                    "username": username,
-                    "purchase_price": purchase_price,
-                    "purchase_date": purchase_date,
-                },
+            _add_purchase_transaction(
+                session, vin, customer_id, username, purchase_price, purchase_date
             )
             session.commit()
+            _clear_read_caches()
             return True  # Return True if the insertion is successful
         except Exception as e:
             session.rollback()
@@ -856,6 +1341,25 @@ def add_purchase_transaction(vin, customer_id, username, purchase_price, purchas
             return False  # Return False if there was an error
 
 
+_INSERT_VEHICLE_COLOR_QUERY = text(
+    """
+    INSERT INTO VehicleColor (vehicle_identification_number, color_name)
+    VALUES (:vin, :color)
+"""
+)
+
+
+def _add_vehicle_colors(session, vin, colors):
+    """
+    Inserts the vehicle's colors in one executemany in the caller's transaction, without committing.
+    """
+    if colors:
+        session.execute(
+            _INSERT_VEHICLE_COLOR_QUERY,
+            [{"vin": vin, "color": color} for color in colors],
+        )
+
+
 def add_vehicle_colors(vin, colors):
     """
     Inserts the VIN and associated color(s) into the VehicleColor table.
@@ -869,15 +1373,9 @@ def add_vehicle_colors(vin, colors):
     """
     with create_session() as session:
         try:
-            for color in colors:
-                session.execute(
-                    """
-                    INSERT INTO VehicleColor (vehicle_identification_number, color_name)
-                    VALUES (:vin, :color)
-                    """,
-                    {"vin": vin, "color": color},
-                )
+            _add_vehicle_colors(session, vin, colors)
             session.commit()
+            _clear_read_caches()
             return True  # Return True if the insertion is successful
         except Exception as e:
             session.rollback()
@@ -910,41 +1408,52 @@ def add_vehicle_and_related_data(
     Returns:
         bool: True if all operations were successful, False otherwise.
     """
-    try:
-
-        # Add the vehicle
-        vehicle_success = add_vehicle(
-            customer_id,
-            vin,
-            vehicle_type,
-            manufacturer,
-            condition,
-            model,
-            year,
-            fuel_type,
-            horsepower,
-            description,
-        )
+    if customer_id is None:
+        return False
 
-        if vehicle_success:
-            color_success = add_vehicle_colors(vin, color)
-            purchase_success = add_purchase_transaction(
-                vin, customer_id, username, purchase_price, purchase_date
+    try:
+        # Vehicle, colors and purchase are written in one transaction
+        with create_session() as session:
+            _add_vehicle(
+                session,
+                vin,
+                vehicle_type,
+                manufacturer,
+                condition,
+                model,
+                year,
+                fuel_type,
+                horsepower,
+                description,
             )
+            _add_vehicle_colors(session, vin, color)
+            _add_purchase_transaction(
+                session, vin, customer_id, username, purchase_price, purchase_date
+            )
+            session.commit()
 
-            # Check if both color and purchase transactions were successful
-            if color_success and purchase_success:
-                return True
-            else:
-                return False
-        else:
-            return False
-
+        _clear_read_caches()
+        return True
     except Exception as e:
         print(f"Error occurred while adding vehicle and related data: {e}")
         return False
 
 
+# Lookup columns served by fetch_distinct_values_from_table, with their prebuilt queries;
+# each column is its table's primary key, so the sorted DISTINCT is a plain index scan
+_DISTINCT_VALUE_QUERIES = {
+    (table_name, column_name): text(
+        f"SELECT DISTINCT {column_name} FROM {table_name} ORDER BY {column_name}"
+    )
+    for table_name, column_name in (
+        ("VehicleType", "vehicle_type"),
+        ("VehicleManufacturer", "manufacturer_name"),
+        ("Color", "color_name"),
+    )
+}
+
+
+@st.cache_data(ttl=_LOOKUP_CACHE_TTL, show_spinner=False)
 def fetch_distinct_values_from_table(table_name: str, column_name: str) -> List[str]:
     """
     Fetches distinct values from a given table and column using raw SQL.
@@ -955,13 +1464,75 @@ def fetch_distinct_values_from_table(table_name: str, column_name: str) -> List[
 
     Returns:
         List[str]: A list of distinct values from the specified column.
+
+    Raises:
+        ValueError: If the table and column are not a known lookup column.
+    """
+    query = _DISTINCT_VALUE_QUERIES.get((table_name, column_name))
+    if query is None:
+        raise ValueError(f"Unsupported lookup column: {table_name}.{column_name}")
+
+    with create_session() as session:
+        return session.execute(query).scalars().all()
+
+
+# SQL query to fetch every vehicle dropdown list in one round trip, tagged by list
+_VEHICLE_LOOKUPS_QUERY = text(
+    """
+    SELECT 'vehicle_types' AS kind, vehicle_type AS value FROM VehicleType
+    UNION ALL SELECT 'manufacturers', manufacturer_name FROM VehicleManufacturer
+    UNION ALL SELECT 'colors', color_name FROM Color
+    ORDER BY kind, value
+"""
+)
+
+
+@st.cache_data(ttl=_LOOKUP_CACHE_TTL, show_spinner=False)
+def get_vehicle_lookups() -> Dict[str, List[str]]:
     """
-    query = f"SELECT DISTINCT {column_name} FROM {table_name}"
+    Fetches the vehicle types, manufacturers and colors used to populate dropdowns.
 
+    Returns:
+        Dict[str, List[str]]: Sorted values under "vehicle_types", "manufacturers" and "colors".
+    """
     with create_session() as session:
-        results = session.execute(query).fetchall()
+        results = _fetch_raw(session, _VEHICLE_LOOKUPS_QUERY)
+
+    lookups = {"vehicle_types": [], "manufacturers": [], "colors": []}
+    for kind, value in results:
+        lookups[kind].append(value)
+
+    return lookups
+
+
+def get_vehicle_types() -> List[str]:
+    """
+    Fetches the vehicle types used to populate dropdowns.
+
+    Returns:
+        List[str]: A list of vehicle types.
+    """
+    return get_vehicle_lookups()["vehicle_types"]
+
+
+def get_manufacturers() -> List[str]:
+    """
+    Fetches the vehicle manufacturers used to populate dropdowns.
+
+    Returns:
+        List[str]: A list of manufacturer names.
+    """
+    return get_vehicle_lookups()["manufacturers"]
+
+
+def get_colors() -> List[str]:
+    """
+    Fetches the vehicle colors used to populate dropdowns.
 
-    return [result[0] for result in results]
+    Returns:
+        List[str]: A list of color names.
+    """
+    return get_vehicle_lookups()["colors"]
 
 
 def get_vehicle_counts() -> tuple:
@@ -974,170 +1545,204 @@ def get_vehicle_counts() -> tuple:
     Returns:
         tuple: A tuple containing the count of vehicles available for sale and those with pending parts.
     """
-    return count_available_cars(), count_cars_with_pending_parts()
+    return count_available_and_pending()
 
 
-def get_vehicle_details_for_public(
-    vin: str = None, role: str = "Public"
+# Vehicle, sale, purchase and parts cost joins shared by the vehicle detail and sale queries
+_VEHICLE_DETAILS_FROM = """
+    FROM Vehicle v
+    LEFT JOIN SaleTransaction st ON v.vehicle_identification_number = st.vehicle_identification_number
+    LEFT JOIN PurchaseTransaction pt ON v.vehicle_identification_number = pt.vehicle_identification_number
+    -- Parts cost per vehicle, maintained by add_parts_order
+    LEFT JOIN VehiclePartsCost vpc ON v.vehicle_identification_number = vpc.vehicle_identification_number
+"""
+
+# One VIN (or all vehicles), a keyset page at a time
+_VEHICLE_DETAILS_PAGE = """
+    AND (:vin IS NULL OR v.vehicle_identification_number = :vin)
+    AND (:after_vin IS NULL OR v.vehicle_identification_number > :after_vin) -- Keyset page start
+    ORDER BY v.vehicle_identification_number ASC
+    LIMIT :limit
+"""
+
+# Public/Salesperson details: vehicles for sale, with only the inputs to their list price
+_PUBLIC_VEHICLE_DETAILS_QUERY = text(
+    f"""
+    SELECT 
+        v.vehicle_identification_number AS VIN,
+        v.vehicle_type AS VehicleType,
+        v.manufacturer_name AS Manufacturer,
+        v.model_name AS Model,
+        v.year AS Year,
+        v.fuel_type AS FuelType,
+        v.horsepower AS Horsepower,
+        -- Always unsold here; _apply_list_price fills in the list price
+        st.sale_price AS SalePrice,
+        v.description AS Description,
+        pt.purchase_price AS BasePurchasePrice,
+        vpc.total_parts_cost AS BasePartsCost
+    {_VEHICLE_DETAILS_FROM}
+    {_AVAILABLE_FOR_SALE_FILTER}
+    {_VEHICLE_DETAILS_PAGE}
+"""
+)
+
+# Staff details: unsold vehicles, or sold ones too when :include_sold is set
+_STAFF_VEHICLE_DETAILS_QUERY = text(
+    f"""
+    SELECT 
+        v.vehicle_identification_number AS VIN,
+        v.vehicle_type AS VehicleType,
+        v.manufacturer_name AS Manufacturer,
+        v.model_name AS Model,
+        v.year AS Year,
+        v.fuel_type AS FuelType,
+        v.horsepower AS Horsepower,
+        -- Recorded sale price; unsold vehicles get their list price in _apply_list_price
+        st.sale_price AS SalePrice,
+        st.sold_on AS SaleDate,
+        pt.purchase_price AS PurchasePrice,
+        pt.purchased_on AS PurchaseDate,
+        ROUND(COALESCE(vpc.total_parts_cost, 0), 2) AS TotalPartsCost,
+        v.description AS Description,
+        pt.purchase_price AS BasePurchasePrice,
+        vpc.total_parts_cost AS BasePartsCost
+    {_VEHICLE_DETAILS_FROM}
+    WHERE (:include_sold = 1 OR st.sale_price IS NULL)
+    {_VEHICLE_DETAILS_PAGE}
+"""
+)
+
+# Default number of vehicles per page of vehicle details (keyset-paginated on VIN)
+_DETAILS_PAGE_SIZE = 100
+
+_PUBLIC_DETAIL_COLUMNS = [
+    "VIN",
+    "VehicleType",
+    "Manufacturer",
+    "Model",
+    "Year",
+    "FuelType",
+    "Colors",
+    "Horsepower",
+    "Description",
+    "SalePrice",
+]
+
+_STAFF_DETAIL_COLUMNS = [
+    "VIN",
+    "VehicleType",
+    "Manufacturer",
+    "Model",
+    "Year",
+    "FuelType",
+    "Colors",
+    "Horsepower",
+    "Description",
+    "TotalPartsCost",
+    "PurchasePrice",
+    "PurchaseDate",
+    "SalePrice",
+    "SaleDate",
+]
+
+
+def _vehicle_details(
+    vin: str, role: str, include_sold: bool, limit: int, after_vin: Optional[str]
 ) -> pd.DataFrame:
     """
-    Searches vehicles based on the provided criteria using raw SQL.
+    Fetches vehicle details visible to a role as Attribute/Value rows.
+
+    Public and Salesperson users only see unsold vehicles without pending parts;
+    other roles see unsold vehicles, or sold ones too when include_sold is set.
+    Vehicles come back in VIN order, a page of at most limit vehicles at a time.
 
     Parameters:
-        vehicle_type (str, optional): The type of vehicle (e.g., Sedan, SUV).
-        manufacturer (str, optional): The vehicle manufacturer.
-        year (int, optional): The manufacturing year.
-        fuel_type (str, optional): The type of fuel used by the vehicle.
-        color (str, optional): The color of the vehicle.
-        keyword (str, optional): A keyword to search within the manufacturer, model, year, and description fields.
-        vin (str, optional): Specific vehicle identification number to search for.
-        vehicle_status (str, optional): Filter by vehicle status ("Sold", "Unsold").
-        role (str): User role performing the search (e.g., Public, Salesperson, Manager, etc.).
+        vin (str): Specific vehicle identification number, or None for all vehicles.
+        role (str): User role viewing the details.
+        include_sold (bool): Whether sold vehicles are included for roles other than Public and Salesperson.
+        limit (int): Maximum number of vehicles to return.
+        after_vin (str, optional): Last VIN of the previous page; only later VINs are returned.
 
     Returns:
-        pd.DataFrame: DataFrame containing matching vehicle details, sorted by vehicle_identification_number.
+        pd.DataFrame: The melted vehicle details.
     """
-    query = """
-        SELECT 
-            v.vehicle_identification_number AS VIN,
-            v.vehicle_type AS VehicleType,
-            v.manufacturer_name AS Manufacturer,
-            v.model_name AS Model,
-            v.year AS Year,
-            v.fuel_type AS FuelType,
-            GROUP_CONCAT(DISTINCT vc.color_name SEPARATOR ', ') AS Colors,
-            v.horsepower AS Horsepower,
-            -- Calculate SalePrice dynamically using aggregated parts cost
-            CASE
-                WHEN st.sale_price IS NOT NULL THEN st.sale_price
-                ELSE ROUND((1.25 * pt.purchase_price) + (1.1 * IFNULL(po_aggregated.TotalPartsCost, 0)), 2)
-            END AS SalePrice,
-            st.sold_on AS SaleDate,
-            pt.purchase_price AS PurchasePrice,
-            pt.purchased_on AS PurchaseDate,
-            ROUND(COALESCE(po_aggregated.TotalPartsCost, 0), 2) AS TotalPartsCost,
-            v.description AS Description
-        FROM Vehicle v
-        LEFT JOIN VehicleColor vc ON v.vehicle_identification_number = vc.vehicle_identification_number
-        LEFT JOIN SaleTransaction st ON v.vehicle_identification_number = st.vehicle_identification_number
-        LEFT JOIN PurchaseTransaction pt ON v.vehicle_identification_number = pt.vehicle_identification_number
-        -- Pre-aggregate PartsOrder costs by vehicle
-        LEFT JOIN (
-            SELECT 
-                vehicle_identification_number, 
-                SUM(total_cost) AS TotalPartsCost
-            FROM PartsOrder
-            GROUP BY vehicle_identification_number
-        ) po_aggregated ON v.vehicle_identification_number = po_aggregated.vehicle_identification_number
-    """
-
-    # Role-Based Filtering
+    params = {"vin": vin, "after_vin": after_vin, "limit": limit}
     if role in ["Public", "Salesperson"]:
-        query += """
-            WHERE st.sale_price IS NULL -- Unsold vehicles only
-            AND NOT EXISTS (
-                SELECT 1 FROM Part p
-                INNER JOIN PartsOrder po_sub ON p.order_number = po_sub.order_number
-                WHERE po_sub.vehicle_identification_number = v.vehicle_identification_number
-                  AND p.status != 'Installed'
-            ) -- No pending parts
-        """
-    elif role in ["Manager", "Owner"]:
-        query += "WHERE 1=1"  # Show details for sold vehicles as well for manager and owner. Improve this condition if possible.
+        query, columns = _PUBLIC_VEHICLE_DETAILS_QUERY, _PUBLIC_DETAIL_COLUMNS
     else:
-        query += "WHERE st.sale_price IS NULL"  # Show all unsold vehicles, with or without pending parts
-
-    if vin:
-        query += " AND v.vehicle_identification_number = :vin"
-
-    query += """
-    GROUP BY 
-        v.vehicle_identification_number, 
-        v.vehicle_type, 
-        v.manufacturer_name, 
-        v.model_name, 
-        v.year, 
-        v.fuel_type, 
-        v.horsepower, 
-        st.sale_price,
-        st.sold_on,
-        pt.purchased_on, 
-        pt.purchase_price,
-        v.description
-    ORDER BY v.vehicle_identification_number ASC
-    """
+        query, columns = _STAFF_VEHICLE_DETAILS_QUERY, _STAFF_DETAIL_COLUMNS
+        params["include_sold"] = int(include_sold)
 
-    # Execute query and fetch results
     with create_session() as session:
-        # Execute the query with the provided VIN
-        result = session.execute(query, {"vin": vin}).fetchall()
-
-    # Convert results to DataFrame
-    df = pd.DataFrame(
-        result,
-        columns=[
-            "VIN",
-            "VehicleType",
-            "Manufacturer",
-            "Model",
-            "Year",
-            "FuelType",
-            "Colors",
-            "Horsepower",
-            "SalePrice",
-            "SaleDate",
-            "PurchasePrice",
-            "PurchaseDate",
-            "TotalPartsCost",
-            "Description",
-        ],
+        df = _read_frame(session, query, params)
+        _attach_colors(session, df, df.columns.get_loc("FuelType") + 1)
+
+    _apply_list_price(df)
+
+    # Equivalent to pd.melt: column-major Attribute/Value pairs, built straight from one object array
+    return pd.DataFrame(
+        {
+            "Attribute": pd.Index(columns).repeat(len(df)),
+            "Value": df[columns].to_numpy(dtype=object).ravel(order="F"),
+        }
     )
 
-    # Adjust columns based on role
-    if role == "Public" or role == "Salesperson":
-        return pd.melt(
-            df[
-                [
-                    "VIN",
-                    "VehicleType",
-                    "Manufacturer",
-                    "Model",
-                    "Year",
-                    "FuelType",
-                    "Colors",
-                    "Horsepower",
-                    "Description",
-                    "SalePrice",
-                ]
-            ],
-            var_name="Attribute",
-            value_name="Value",
-        )
-    else:
-        return pd.melt(
-            df[
-                [
-                    "VIN",
-                    "VehicleType",
-                    "Manufacturer",
-                    "Model",
-                    "Year",
-                    "FuelType",
-                    "Colors",
-                    "Horsepower",
-                    "Description",
-                    "TotalPartsCost",
-                    "PurchasePrice",
-                    "PurchaseDate",
-                    "SalePrice",
-                    "SaleDate",
-                ]
-            ],
-            var_name="Attribute",
-            value_name="Value",
-        )
+
+@st.cache_data(ttl=_READ_CACHE_TTL, show_spinner=False)
+def get_vehicle_details_for_public(
+    vin: str = None,
+    role: str = "Public",
+    limit: int = _DETAILS_PAGE_SIZE,
+    after_vin: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    Fetches vehicle details for the details page; Managers and Owners also see sold vehicles.
+
+    Parameters:
+        vin (str, optional): Specific vehicle identification number to fetch.
+        role (str): User role viewing the details (e.g., Public, Salesperson, Manager, etc.).
+        limit (int): Maximum number of vehicles to return.
+        after_vin (str, optional): Last VIN already shown; the page starts after it.
+
+    Returns:
+        pd.DataFrame: The vehicle details visible to the role, as Attribute/Value rows.
+    """
+    return _vehicle_details(
+        vin, role, role in ["Manager", "Owner"], limit=limit, after_vin=after_vin
+    )
 
 
+# SQL query to fetch vehicle details for sale
+_VEHICLE_DETAILS_FOR_SALE_QUERY = text(
+    f"""
+    SELECT 
+        v.vehicle_identification_number AS VIN,
+        v.vehicle_type AS VehicleType,
+        v.manufacturer_name AS Manufacturer,
+        v.model_name AS Model,
+        v.year AS Year,
+        v.fuel_type AS FuelType,
+        v.horsepower AS Horsepower,
+        -- Calculate SalePrice dynamically using the vehicle's parts cost
+        CASE
+            WHEN st.sale_price IS NOT NULL THEN st.sale_price
+            ELSE ROUND((1.25 * pt.purchase_price) + (1.1 * IFNULL(vpc.total_parts_cost, 0)), 2)
+        END AS SalePrice,
+        st.sold_on,
+        pt.purchase_price AS PurchasePrice,
+        pt.purchased_on AS PurchaseDate,
+        ROUND(COALESCE(vpc.total_parts_cost, 0), 2) AS TotalPartsCost,
+        v.description AS Description,
+        v.condition as VehicleCondition
+    {_VEHICLE_DETAILS_FROM}
+    WHERE v.vehicle_identification_number = :vin
+    AND st.vehicle_identification_number IS NULL  -- Ensure vehicle is not sold
+"""
+)
+
+
+@st.cache_data(ttl=_READ_CACHE_TTL, show_spinner=False)
 def get_vehicle_details_for_sale(vin: str) -> Optional[Dict[str, str]]:
     """
     Fetches vehicle details for a vehicle that is eligible for sale based on the provided VIN.
@@ -1152,80 +1757,28 @@ def get_vehicle_details_for_sale(vin: str) -> Optional[Dict[str, str]]:
                                   None otherwise.
     """
     with create_session() as session:
-        # SQL query to fetch vehicle details for sale
-        query = """
-            SELECT 
-                v.vehicle_identification_number AS VIN,
-                v.vehicle_type AS VehicleType,
-                v.manufacturer_name AS Manufacturer,
-                v.model_name AS Model,
-                v.year AS Year,
-                v.fuel_type AS FuelType,
-                GROUP_CONCAT(DISTINCT vc.color_name SEPARATOR ', ') AS Colors,
-                v.horsepower AS Horsepower,
-                -- Calculate SalePrice dynamically using aggregated parts cost
-                CASE
-                    WHEN st.sale_price IS NOT NULL THEN st.sale_price
-                    ELSE ROUND((1.25 * pt.purchase_price) + (1.1 * IFNULL(po_aggregated.TotalPartsCost, 0)), 2)
-                END AS SalePrice,
-                st.sold_on,
-                pt.purchase_price AS PurchasePrice,
-                pt.purchased_on AS PurchaseDate,
-                ROUND(COALESCE(po_aggregated.TotalPartsCost, 0), 2) AS TotalPartsCost,
-                v.description AS Description,
-                v.condition as VehicleCondition
-            FROM Vehicle v
-            LEFT JOIN VehicleColor vc ON v.vehicle_identification_number = vc.vehicle_identification_number
-            LEFT JOIN SaleTransaction st ON v.vehicle_identification_number = st.vehicle_identification_number
-            LEFT JOIN PurchaseTransaction pt ON v.vehicle_identification_number = pt.vehicle_identification_number
-            -- Pre-aggregate PartsOrder costs by vehicle
-            LEFT JOIN (
-                SELECT 
-                    vehicle_identification_number, 
-                    SUM(total_cost) AS TotalPartsCost
-                FROM PartsOrder
-                GROUP BY vehicle_identification_number
-            ) po_aggregated ON v.vehicle_identification_number = po_aggregated.vehicle_identification_number
-            WHERE v.vehicle_identification_number = :vin
-            AND v.vehicle_identification_number NOT IN (
-                SELECT vehicle_identification_number 
-                FROM SaleTransaction
-            )  -- Ensure vehicle is not sold
-            GROUP BY 
-                v.vehicle_identification_number, 
-                v.vehicle_type, 
-                v.manufacturer_name, 
-                v.model_name, 
-                v.year, 
-                v.fuel_type, 
-                v.horsepower, 
-                st.sale_price,
-                st.sold_on,
-                pt.purchased_on, 
-                pt.purchase_price,
-                v.description,
-                v.condition
-        """
-
         # Execute the query with the provided VIN
-        result = session.execute(query, {"vin": vin}).fetchone()
+        result = session.execute(
+            _VEHICLE_DETAILS_FOR_SALE_QUERY, {"vin": vin}
+        ).fetchone()
 
         # If the vehicle is found, return the details as a dictionary
         if result:
+            row = result._mapping  # Resolve column names once, not per key lookup
             vehicle_details = {
-                "VIN": result["VIN"],
-                "VehicleType": result["VehicleType"],
-                "Manufacturer": result["Manufacturer"],
-                "Model": result["Model"],
-                "Year": result["Year"],
-                "FuelType": result["FuelType"],
-                "Horsepower": result["Horsepower"],
-                "Colors": result["Colors"],
-                "Condition": result["VehicleCondition"],
-                "Description": result["Description"],
-                "PurchasePrice": result["PurchasePrice"],
-                "PurchaseDate": result["PurchaseDate"],
-                "SalePrice": result["SalePrice"],
+                "VIN": row["VIN"],
+                "VehicleType": row["VehicleType"],
+                "Manufacturer": row["Manufacturer"],
+                "Model": row["Model"],
+                "Year": row["Year"],
+                "FuelType": row["FuelType"],
+                "Horsepower": row["Horsepower"],
+                "Colors": _vehicle_colors(session, [row["VIN"]]).get(row["VIN"]),
+                "Condition": row["VehicleCondition"],
+                "Description": row["Description"],
+                "PurchasePrice": row["PurchasePrice"],
+                "PurchaseDate": row["PurchaseDate"],
+                "SalePrice": row["SalePrice"],
             }
             return vehicle_details
         else:
@@ -1233,178 +1786,31 @@ def get_vehicle_details_for_sale(vin: str) -> Optional[Dict[str, str]]:
             return None
 
 
-def get_vehicle_details(vin: str = None, role: str = "Public") -> pd.DataFrame:
+@st.cache_data(ttl=_READ_CACHE_TTL, show_spinner=False)
+def get_vehicle_details(
+    vin: str = None,
+    role: str = "Public",
+    limit: int = _DETAILS_PAGE_SIZE,
+    after_vin: Optional[str] = None,
+) -> pd.DataFrame:
     """
-    Searches vehicles based on the provided criteria using raw SQL.
+    Fetches details of unsold vehicles for the details page.
 
     Parameters:
-        vehicle_type (str, optional): The type of vehicle (e.g., Sedan, SUV).
-        manufacturer (str, optional): The vehicle manufacturer.
-        year (int, optional): The manufacturing year.
-        fuel_type (str, optional): The type of fuel used by the vehicle.
-        color (str, optional): The color of the vehicle.
-        keyword (str, optional): A keyword to search within the manufacturer, model, year, and description fields.
-        vin (str, optional): Specific vehicle identification number to search for.
-        vehicle_status (str, optional): Filter by vehicle status ("Sold", "Unsold").
-        role (str): User role performing the search (e.g., Public, Salesperson, Manager, etc.).
+        vin (str, optional): Specific vehicle identification number to fetch.
+        role (str): User role viewing the details (e.g., Public, Salesperson, Manager, etc.).
+        limit (int): Maximum number of vehicles to return.
+        after_vin (str, optional): Last VIN already shown; the page starts after it.
 
     Returns:
-        pd.DataFrame: DataFrame containing matching vehicle details, sorted by vehicle_identification_number.
-    """
-    query = """
-        SELECT 
-            v.vehicle_identification_number AS VIN,
-            v.vehicle_type AS VehicleType,
-            v.manufacturer_name AS Manufacturer,
-            v.model_name AS Model,
-            v.year AS Year,
-            v.fuel_type AS FuelType,
-            GROUP_CONCAT(DISTINCT vc.color_name SEPARATOR ', ') AS Colors,
-            v.horsepower AS Horsepower,
-            -- Calculate SalePrice dynamically using aggregated parts cost
-            CASE
-                WHEN st.sale_price IS NOT NULL THEN st.sale_price
-                ELSE ROUND((1.25 * pt.purchase_price) + (1.1 * IFNULL(po_aggregated.TotalPartsCost, 0)), 2)
-            END AS SalePrice,
-            st.sold_on AS SaleDate,
-            pt.purchase_price AS PurchasePrice,
-            pt.purchased_on AS PurchaseDate,
-            ROUND(COALESCE(po_aggregated.TotalPartsCost, 0), 2) AS TotalPartsCost,
-            v.description AS Description
-        FROM Vehicle v
-        LEFT JOIN VehicleColor vc ON v.vehicle_identification_number = vc.vehicle_identification_number
-        LEFT JOIN SaleTransaction st ON v.vehicle_identification_number = st.vehicle_identification_number
-        LEFT JOIN PurchaseTransaction pt ON v.vehicle_identification_number = pt.vehicle_identification_number
-        -- Pre-aggregate PartsOrder costs by vehicle
-        LEFT JOIN (
-            SELECT 
-                vehicle_identification_number, 
-                SUM(total_cost) AS TotalPartsCost
-            FROM PartsOrder
-            GROUP BY vehicle_identification_number
-        ) po_aggregated ON v.vehicle_identification_number = po_aggregated.vehicle_identification_number
-    """
-
-    # Role-Based Filtering
-    if role in ["Public", "Salesperson"]:
-        query += """
-            WHERE st.sale_price IS NULL -- Unsold vehicles only
-            AND NOT EXISTS (
-                SELECT 1 FROM Part p
-                INNER JOIN PartsOrder po_sub ON p.order_number = po_sub.order_number
-                WHERE po_sub.vehicle_identification_number = v.vehicle_identification_number
-                  AND p.status != 'Installed'
-            ) -- No pending parts
-        """
-    else:
-        query += "WHERE st.sale_price IS NULL"  # Show all unsold vehicles, with or without pending parts
-
-    if vin:
-        query += " AND v.vehicle_identification_number = :vin"
-
-    query += """
-    GROUP BY 
-        v.vehicle_identification_number, 
-        v.vehicle_type, 
-        v.manufacturer_name, 
-        v.model_name, 
-        v.year, 
-        v.fuel_type, 
-        v.horsepower, 
-        st.sale_price,
-        st.sold_on,
-        pt.purchased_on, 
-        pt.purchase_price,
-        v.description
-    ORDER BY v.vehicle_identification_number ASC
-    """
-
-    # Execute query and fetch results
-    with create_session() as session:
-        # Execute the query with the provided VIN
-        result = session.execute(query, {"vin": vin}).fetchall()
-
-    # Convert results to DataFrame
-    df = pd.DataFrame(
-        result,
-        columns=[
-            "VIN",
-            "VehicleType",
-            "Manufacturer",
-            "Model",
-            "Year",
-            "FuelType",
-            "Colors",
-            "Horsepower",
-            "SalePrice",
-            "SaleDate",
-            "PurchasePrice",
-            "PurchaseDate",
-            "TotalPartsCost",
-            "Description",
-        ],
-    )
-
-    # Adjust columns based on role
-    if role == "Public" or role == "Salesperson":
-        return pd.melt(
-            df[
-                [
-                    "VIN",
-                    "VehicleType",
-                    "Manufacturer",
-                    "Model",
-                    "Year",
-                    "FuelType",
-                    "Colors",
-                    "Horsepower",
-                    "Description",
-                    "SalePrice",
-                ]
-            ],
-            var_name="Attribute",
-            value_name="Value",
-        )
-    else:
-        return pd.melt(
-            df[
-                [
-                    "VIN",
-                    "VehicleType",
-                    "Manufacturer",
-                    "Model",
-                    "Year",
-                    "FuelType",
-                    "Colors",
-                    "Horsepower",
-                    "Description",
-                    "TotalPartsCost",
-                    "PurchasePrice",
-                    "PurchaseDate",
-                    "SalePrice",
-                    "SaleDate",
-                ]
-            ],
-            var_name="Attribute",
-            value_name="Value",
-        )
-
-
-def get_vehicle_parts(vin: str):
+        pd.DataFrame: The vehicle details visible to the role, as Attribute/Value rows.
     """
-    Fetches the vehicle details and associated parts order information for a specific vehicle.
+    return _vehicle_details(vin, role, False, limit=limit, after_vin=after_vin)
 
-    Parameters:
-        vin (str): The Vehicle Identification Number (VIN) of the vehicle.
 
-    Returns:
-        tuple: A tuple containing two elements:
-            - vehicle_details (dict): A dictionary containing the vehicle details.
-            - parts_orders (list): A list of dictionaries containing parts order details.
+# Query for parts order details
+_VEHICLE_PARTS_QUERY = text(
     """
-
-    # Query for parts order details
-    parts_query = """
     SELECT 
         po.order_number AS OrderNumber,
         p.vendor_parts_number AS VendorPartNumber,
@@ -1418,18 +1824,62 @@ def get_vehicle_parts(vin: str):
     JOIN Part p ON po.order_number = p.order_number
     JOIN Vendor v ON po.name = v.name
     WHERE po.vehicle_identification_number = :vin;
+"""
+)
+
+
+@st.cache_data(ttl=_READ_CACHE_TTL, show_spinner=False)
+def get_vehicle_parts(vin: str):
     """
+    Fetches the vehicle details and associated parts order information for a specific vehicle.
 
-    # Initialize results variables
-    parts_orders = []
+    Parameters:
+        vin (str): The Vehicle Identification Number (VIN) of the vehicle.
 
+    Returns:
+        tuple: A tuple containing two elements:
+            - vehicle_details (dict): A dictionary containing the vehicle details.
+            - parts_orders (list): A list of dictionaries containing parts order details.
+    """
     with create_session() as session:
-        # Execute parts orders query
-        parts_result = session.execute(parts_query, {"vin": vin}).fetchall()
-        for part in parts_result:
-            parts_orders.append(dict(part))
+        parts_result = session.execute(_VEHICLE_PARTS_QUERY, {"vin": vin}).mappings()
+        return [dict(part) for part in parts_result]
+
+
+# Part status -> statuses a part may move to it from (Ordered -> Received -> Installed)
+_PART_STATUS_PREDECESSORS = {
+    "Ordered": frozenset(),
+    "Received": frozenset({"Ordered"}),
+    "Installed": frozenset({"Ordered", "Received"}),
+}
+
+
+def next_part_statuses(status: str) -> List[str]:
+    """
+    Lists the statuses a part in the given status may be moved on to.
+
+    Parameters:
+        status (str): The part's current status.
+
+    Returns:
+        List[str]: The allowed next statuses, in workflow order.
+    """
+    return [
+        new_status
+        for new_status, predecessors in _PART_STATUS_PREDECESSORS.items()
+        if status in predecessors
+    ]
+
 
-    return parts_orders
+# Moves a part to a new status only if its current status allows the transition
+_SET_PART_STATUS_QUERY = text(
+    """
+    UPDATE Part
+    SET status = :new_status
+    WHERE order_number = :order_number AND vendor_parts_number = :vendor_part_number
+      AND status IN :allowed_statuses
+"""
+).bindparams(bindparam("allowed_statuses", expanding=True))
 
 
 def update_part_status(
@@ -1438,6 +1888,9 @@ def update_part_status(
     """
     Updates the status of a part based on the provided order number and vendor part number.
 
+    The transition check is part of the UPDATE, so an unknown part or an invalid
+    transition simply updates no rows.
+
     Parameters:
         order_number (str): The order number associated with the part.
         vendor_part_number (str): The vendor part number.
@@ -1446,55 +1899,69 @@ def update_part_status(
     Returns:
         bool: True if the status update is successful, False otherwise.
     """
-    # Define valid status transitions
-    valid_status_transitions = {
-        "Ordered": ["Received", "Installed"],
-        "Received": ["Installed"],
-        "Installed": [],
-    }
+    allowed_statuses = _PART_STATUS_PREDECESSORS.get(new_status)
+    if not allowed_statuses:
+        return False
 
     with create_session() as session:
-        current_status = session.execute(
-            """
-            SELECT status
-            FROM Part
-            WHERE order_number = :order_number AND vendor_parts_number = :vendor_part_number
-            """,
-            {"order_number": order_number, "vendor_part_number": vendor_part_number},
-        ).fetchone()
-
-        if not current_status:
-            return False
-
-        current_status = current_status[0]
-
-        # Check if the new status is a valid transition
-        if new_status in valid_status_transitions.get(current_status, []):
-            # Update the part status
-            session.execute(
-                """
-                UPDATE Part
-                SET status = :new_status
-                WHERE order_number = :order_number AND vendor_parts_number = :vendor_part_number
-                """,
+        try:
+            result = session.execute(
+                _SET_PART_STATUS_QUERY,
                 {
                     "new_status": new_status,
                     "order_number": order_number,
                     "vendor_part_number": vendor_part_number,
+                    "allowed_statuses": sorted(allowed_statuses),
                 },
             )
+            if result.rowcount != 1:
+                session.rollback()
+                return False
+
             session.commit()
+            _clear_read_caches()
             return True
+        except Exception as e:
+            session.rollback()
+            print(f"Error updating part status: {e}")
+            return False
 
-        return False
+
+# SQL query to insert a sale transaction, unless the vehicle has already been sold
+_INSERT_SALE_QUERY = text(
+    """
+    INSERT INTO SaleTransaction (
+        vehicle_identification_number,
+        customer_id,
+        username,
+        sold_on,
+        sale_price
+    )
+    SELECT
+        :vin,
+        :customer_id,
+        :username,
+        :sale_date,
+        :sale_price
+    FROM DUAL
+    WHERE NOT EXISTS (
+        SELECT 1
+        FROM SaleTransaction
+        WHERE vehicle_identification_number = :vin
+    )
+"""
+)
 
 
 def record_sale(
     vin: str, customer_identifier: str, username: str, sale_date: str, sale_price: float
-) -> str:
+) -> bool:
     """
     Records a sale in the SalesTransaction table.
 
+    The already-sold check is part of the INSERT, so recording the same sale twice
+    (e.g. a double-clicked button) inserts nothing the second time.
+
     Parameters:
         vin (str): Vehicle Identification Number.
         customer_identifier (str): SSN or Tax ID of the customer.
@@ -1503,31 +1970,13 @@ def record_sale(
         sale_price (float): Sale price of the vehicle.
 
     Returns:
-        str: Success or error message indicating the result of the operation.
+        bool: True if the sale was recorded, False otherwise.
     """
     with create_session() as session:
 
-        # Insert the sale transaction
-        sale_query = """
-            INSERT INTO SaleTransaction (
-                vehicle_identification_number,
-                customer_id,
-                username,
-                sold_on,
-                sale_price
-            )
-            VALUES (
-                :vin,
-                :customer_id,
-                :username,
-                :sale_date,
-                :sale_price
-            )
-        """
-
         try:
-            session.execute(
-                sale_query,
+            result = session.execute(
+                _INSERT_SALE_QUERY,
                 {
                     "vin": vin,
                     "customer_id": customer_identifier,
@@ -1536,13 +1985,38 @@ def record_sale(
                     "sale_price": sale_price,
                 },
             )
+            if result.rowcount != 1:
+                session.rollback()
+                print(f"Sale not recorded: vehicle {vin} is already sold")
+                return False
+
             session.commit()
+            _clear_read_caches()
             return True
         except Exception as e:
             session.rollback()
+            print(f"Error occurred while recording sale: {e}")
             return False
 
 
+# Seller contact and inventory clerk for a purchased vehicle, in one round trip
+_PURCHASE_DETAILS_QUERY = text(
+    """
+    SELECT 
+        c.email AS CustomerEmail,
+        c.phone_number AS CustomerPhone,
+        CONCAT(c.address_street, ', ', c.address_city, ', ', c.address_state, ' ', c.address_postal_code) AS FullAddress,
+        u.first_name AS ClerkFirstName,
+        u.last_name AS ClerkLastName,
+        u.username AS ClerkUserName
+    FROM PurchaseTransaction pt
+    JOIN Customer c ON c.id = pt.customer_id
+    JOIN User u ON u.username = pt.username
+    WHERE pt.vehicle_identification_number = :vin
+"""
+)
+
+
 def get_purchase_details(vin: str) -> Optional[Dict[str, str]]:
     """
     Fetches customer contact details and inventory clerk's information for a purchased vehicle.
@@ -1555,63 +2029,39 @@ def get_purchase_details(vin: str) -> Optional[Dict[str, str]]:
                                   or None if the vehicle has not been purchased.
     """
     with create_session() as session:
-        # Step 1: Check if the VIN exists in the PurchaseTransaction table and fetch customer_id and username
-        purchase_query = """
-            SELECT 
-                pt.customer_id AS CustomerID,
-                pt.username AS ClerkUsername
-            FROM PurchaseTransaction pt
-            WHERE pt.vehicle_identification_number = :vin
-        """
-        purchase_result = session.execute(purchase_query, {"vin": vin}).fetchone()
-
-        if not purchase_result:
-            # Return None if the vehicle is not in PurchaseTransaction
-            return None
+        result = session.execute(_PURCHASE_DETAILS_QUERY, {"vin": vin}).fetchone()
 
-        # Extract customer_id and username
-        customer_id = purchase_result["CustomerID"]
-        clerk_username = purchase_result["ClerkUsername"]
-
-        # Step 2: Fetch customer contact details
-        customer_query = """
-            SELECT 
-                email AS CustomerEmail,
-                phone_number AS CustomerPhone,
-                CONCAT(address_street, ', ', address_city, ', ', address_state, ' ', address_postal_code) AS FullAddress
-            FROM Customer
-            WHERE id = :customer_id
-        """
-        customer_result = session.execute(
-            customer_query, {"customer_id": customer_id}
-        ).fetchone()
+    # Return None if the vehicle is not in PurchaseTransaction or its seller/clerk is missing
+    if not result:
+        return None
 
-        # Step 3: Fetch inventory clerk details from the User table
-        clerk_query = """
-            SELECT 
-                first_name AS ClerkFirstName,
-                last_name AS ClerkLastName,
-                username AS ClerkUserName
-            FROM User
-            WHERE username = :username
-        """
-        clerk_result = session.execute(
-            clerk_query, {"username": clerk_username}
-        ).fetchone()
+    row = result._mapping  # Resolve column names once, not per key lookup
+    return {
+        "External Seller Email": row["CustomerEmail"],
+        "External Seller Phone": row["CustomerPhone"],
+        "External Seller Address": row["FullAddress"],
+        "Inventory Clerk First Name": row["ClerkFirstName"],
+        "Inventory Clerk Last Name": row["ClerkLastName"],
+        "Inventory Clerk Username": row["ClerkUserName"],
+    }
 
-        # Combine results into a single dictionary
-        if customer_result and clerk_result:
-            return {
-                "External Seller Email": customer_result["CustomerEmail"],
-                "External Seller Phone": customer_result["CustomerPhone"],
-                "External Seller Address": customer_result["FullAddress"],
-                "Inventory Clerk First Name": clerk_result["ClerkFirstName"],
-                "Inventory Clerk Last Name": clerk_result["ClerkLastName"],
-                "Inventory Clerk Username": clerk_result["ClerkUserName"],
-            }
 
-        # Handle incomplete data gracefully
-        return None
+# Buyer contact and salesperson for a sold vehicle, in one round trip
+_SALE_DETAILS_QUERY = text(
+    """
+    SELECT 
+        c.email AS CustomerEmail,
+        c.phone_number AS CustomerPhone,
+        CONCAT(c.address_street, ', ', c.address_city, ', ', c.address_state, ' ', c.address_postal_code) AS FullAddress,
+        u.first_name AS FirstName,
+        u.last_name AS LastName,
+        u.username AS UserName
+    FROM SaleTransaction st
+    JOIN Customer c ON c.id = st.customer_id
+    JOIN User u ON u.username = st.username
+    WHERE st.vehicle_identification_number = :vin
+"""
+)
 
 
 def get_sale_details(vin: str) -> Optional[Dict[str, str]]:
@@ -1626,95 +2076,18 @@ def get_sale_details(vin: str) -> Optional[Dict[str, str]]:
                                   or None if the vehicle has not been purchased.
     """
     with create_session() as session:
-        # Step 1: Check if the VIN exists in the PurchaseTransaction table and fetch customer_id and username
-        purchase_query = """
-            SELECT 
-                customer_id AS CustomerID,
-                username AS SaleUsername
-            FROM SaleTransaction
-            WHERE vehicle_identification_number = :vin
-        """
-        sale_result = session.execute(purchase_query, {"vin": vin}).fetchone()
-
-        if not sale_result:
-            # Return None if the vehicle is not in PurchaseTransaction
-            return None
-
-        # Extract customer_id and username
-        customer_id = sale_result["CustomerID"]
-        sale_username = sale_result["SaleUsername"]
-
-        # Step 2: Fetch customer contact details
-        customer_query = """
-            SELECT 
-                email AS CustomerEmail,
-                phone_number AS CustomerPhone,
-                CONCAT(address_street, ', ', address_city, ', ', address_state, ' ', address_postal_code) AS FullAddress
-            FROM Customer
-            WHERE id = :customer_id
-        """
-        customer_result = session.execute(
-            customer_query, {"customer_id": customer_id}
-        ).fetchone()
-
-        # Step 3: Fetch inventory clerk details from the User table
-        sale_query = """
-            SELECT 
-                first_name AS FirstName,
-                last_name AS LastName,
-                username AS UserName
-            FROM User
-            WHERE username = :username
-        """
-        person_result = session.execute(
-            sale_query, {"username": sale_username}
-        ).fetchone()
+        result = session.execute(_SALE_DETAILS_QUERY, {"vin": vin}).fetchone()
 
-        # Combine results into a single dictionary
-        if customer_result and person_result:
-            return {
-                "Customer Email": customer_result["CustomerEmail"],
-                "Customer Phone": customer_result["CustomerPhone"],
-                "Customer Address": customer_result["FullAddress"],
-                "Seller First Name": person_result["FirstName"],
-                "Seller Last Name": person_result["LastName"],
-                "Seller Username": person_result["UserName"],
-            }
-
-        # Handle incomplete data gracefully
+    # Return None if the vehicle is not in SaleTransaction or its buyer/salesperson is missing
+    if not result:
         return None
 
-
-def update_status(new_status: str, vendor_part_number: str, order_number: str) -> bool:
-    """
-    Updates the status of a part in the Part table.
-
-    Parameters:
-        new_status (str): The new status to set (e.g., "Received", "Installed").
-        vendor_part_number (str): The vendor part number of the part to update.
-        order_number (str): The order number associated with the part.
-
-    Returns:
-        bool: True if the update was successful, False otherwise.
-    """
-    query = """
-        UPDATE Part
-        SET status = :new_status
-        WHERE vendor_parts_number = :vendor_part_number
-          AND order_number = :order_number
-    """
-    try:
-        with create_session() as session:
-            result = session.execute(
-                text(query),
-                {
-                    "new_status": new_status,
-                    "vendor_part_number": vendor_part_number,
-                    "order_number": order_number,
-                },
-            )
-            session.commit()
-            return result.rowcount > 0  # Check if any rows were updated
-    except Exception as e:
-        print(f"Error updating part status: {e}")
-        return False
+    row = result._mapping  # Resolve column names once, not per key lookup
+    return {
+        "Customer Email": row["CustomerEmail"],
+        "Customer Phone": row["CustomerPhone"],
+        "Customer Address": row["FullAddress"],
+        "Seller First Name": row["FirstName"],
+        "Seller Last Name": row["LastName"],
+        "Seller Username": row["UserName"],
+    }
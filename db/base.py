@@ -1,9 +1,8 @@
-from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
-from config import current_config
+from config import get_engine
 
 # Initialize the SQLAlchemy Base class
 Base = declarative_base()
 
-# Create the database engine using the configured database URI
-engine = create_engine(current_config.SQLALCHEMY_DATABASE_URI, echo=True)
+# Share the pooled engine configured in config.py
+engine = get_engine()
@@ -1,3 +1,4 @@
+from sqlalchemy import select
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.sql.schema import Column
 from typing import List
@@ -34,6 +35,7 @@ def fetch_distinct_values(column: Column) -> List[str]:
         List[str]: A sorted list of unique values from the specified column.
     """
     with create_session() as session:
-        return [
-            row[0] for row in session.query(column).distinct().order_by(column).all()
-        ]
+        # Core select returning scalars; no ORM rows are built for the values
+        return list(
+            session.execute(select(column).distinct().order_by(column)).scalars()
+        )
@@ -0,0 +1,17 @@
+-- Per-vehicle parts cost, kept in step with PartsOrder by add_parts_order
+CREATE TABLE VehiclePartsCost (
+    vehicle_identification_number VARCHAR(255) NOT NULL,
+    total_parts_cost DECIMAL(12, 2) NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (vehicle_identification_number)
+);
+
+ALTER TABLE VehiclePartsCost
+    ADD CONSTRAINT fk_VehiclePartsCost_vin_Vehicle_vin FOREIGN KEY (vehicle_identification_number)
+    REFERENCES Vehicle (vehicle_identification_number);
+
+-- Backfill from existing orders
+INSERT INTO VehiclePartsCost (vehicle_identification_number, total_parts_cost)
+SELECT vehicle_identification_number, SUM(total_cost)
+FROM PartsOrder
+GROUP BY vehicle_identification_number;
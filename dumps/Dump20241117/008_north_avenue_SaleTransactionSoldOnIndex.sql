@@ -0,0 +1,2 @@
+-- Covers the monthly sales summary and drilldown, which group and filter on sold_on
+CREATE INDEX ix_saletransaction_soldon ON SaleTransaction (sold_on, vehicle_identification_number, sale_price);
@@ -0,0 +1,11 @@
+-- Covering indexes for the VIN joins used by vehicle search, counts and reports.
+-- InnoDB secondary indexes already carry the primary key columns, so those are not repeated.
+CREATE INDEX ix_saletransaction_vin_price ON SaleTransaction (vehicle_identification_number, sale_price, sold_on);
+
+CREATE INDEX ix_purchasetransaction_vin_price ON PurchaseTransaction (vehicle_identification_number, purchase_price, purchased_on);
+
+CREATE INDEX ix_partsorder_vin_cost ON PartsOrder (vehicle_identification_number, total_cost);
+
+CREATE INDEX ix_part_order_status ON Part (order_number, status, quantity, unit_price);
+
+CREATE INDEX ix_vehicle_type_manufacturer_year ON Vehicle (vehicle_type, manufacturer_name, `year`, fuel_type);
@@ -0,0 +1,3 @@
+-- Inverted index for the vehicle search keyword filter (MATCH ... AGAINST)
+ALTER TABLE Vehicle
+    ADD FULLTEXT INDEX ft_vehicle_search (manufacturer_name, model_name, description);
@@ -1,15 +1,16 @@
 import streamlit as st
-from db.session import create_session
 from controllers.extract_data import (
     add_parts_order,
     add_vendor,
+    fetch_vendors,
     get_vehicle_details_for_sale,
 )
-import time
+from utils.flash import flash, show_flash
 
 
 def add_parts_order_page():
     """Renders the Add Parts Order page."""
+    show_flash()
     st.markdown(
         "<h4 style=text-align:center;>Add Parts Order</h4>", unsafe_allow_html=True
     )
@@ -33,13 +34,8 @@ def add_parts_order_page():
     if "selected_vendor" not in st.session_state:
         st.session_state["selected_vendor"] = None
 
-    # Initialize session state for vendor names if not initialized
-    if "vendor_names" not in st.session_state:
-        with create_session() as session:
-            vendors = session.execute("SELECT name FROM Vendor").fetchall()
-            st.session_state.vendor_names = [
-                vendor[0] for vendor in vendors
-            ]  # Extract vendor names
+    # Vendor names are cached across sessions and refreshed when a vendor is added
+    st.session_state.vendor_names = fetch_vendors()
 
     vin1, vin2 = st.columns([1, 1], gap="medium")
     with vin1:
@@ -103,10 +99,7 @@ def add_parts_order_page():
                             new_vendor_state,
                             new_vendor_postal_code,
                         ):
-                            st.success(
-                                f"Vendor '{new_vendor_name}' added successfully!"
-                            )
-                            time.sleep(1)
+                            flash(f"Vendor '{new_vendor_name}' added successfully!")
                             st.rerun()
                         else:
                             st.error("Failed to add vendor. Vendor may already exist.")
@@ -226,8 +219,8 @@ def add_parts_order_page():
                     key=f"vendor_part_{idx}",
                 )
 
-            # Update the part in session state
-            st.session_state[f"part_{idx}"] = {
+            # Update the part in session state only when a field changed
+            updated_part = {
                 "part_description": part_description.strip(),
                 "vendor_part_number": vendor_part_number.strip(),
                 "unit_price": unit_price,
@@ -235,6 +228,8 @@ def add_parts_order_page():
                 "part_status": part_status,
                 "selected_vendor": selected_vendor,
             }
+            if updated_part != part:
+                st.session_state[f"part_{idx}"] = updated_part
 
             # Add horizontal line after each part, except after the last one
             if idx < st.session_state["num_parts"] - 1:
@@ -279,7 +274,7 @@ def add_parts_order_page():
                     success = add_parts_order(vin, part["selected_vendor"], parts)
 
                     if success:
-                        st.success("Parts order added successfully!")
+                        flash("Parts order added successfully!")
 
                         # Reset session state variables
                         st.session_state["forms_generated"] = False
@@ -289,7 +284,6 @@ def add_parts_order_page():
                             if key.startswith("part_"):
                                 del st.session_state[key]
 
-                        time.sleep(2)
                         st.rerun()  # Rerun the app to reset the form
                         st.switch_page(st.Page("pages/details.py"))
                     else:
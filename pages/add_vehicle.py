@@ -1,40 +1,14 @@
 import streamlit as st
-from db.session import create_session
 from controllers.extract_data import (
     lookup_customers,
     add_customer,
     add_vehicle_and_related_data,
     fetch_customer_id,
+    get_vehicle_lookups,
 )
 from datetime import datetime
 from typing import List
-import time
-
-
-def fetch_vehicle_data() -> dict:
-    """
-    Fetches available vehicle types, manufacturers, and colors from the database.
-
-    Parameters:
-        None
-
-    Returns:
-        dict: Contains lists of vehicle types, manufacturers, and colors.
-    """
-    with create_session() as session:
-        vehicle_types = session.execute(
-            "SELECT vehicle_type FROM VehicleType"
-        ).fetchall()
-        manufacturer_options = session.execute(
-            "SELECT manufacturer_name FROM VehicleManufacturer"
-        ).fetchall()
-        color_options = session.execute("SELECT color_name FROM Color").fetchall()
-
-    return {
-        "vehicle_types": [v[0] for v in vehicle_types],
-        "manufacturers": [m[0] for m in manufacturer_options],
-        "colors": [c[0] for c in color_options],
-    }
+from utils.flash import flash, show_flash
 
 
 def get_purchase_date() -> str:
@@ -105,6 +79,7 @@ def add_vehicle_page() -> None:
     Returns:
         None
     """
+    show_flash()
     st.markdown("<h4 style=text-align:center;>Add Vehicle</h4>", unsafe_allow_html=True)
     st.write("")
     st.write("")
@@ -116,47 +91,56 @@ def add_vehicle_page() -> None:
             "<h5 style=text-align:center;>Vehicle Details</h5>", unsafe_allow_html=True
         )
 
-        sub_col1, sub_col2 = st.columns([1, 1], gap="medium")
-
-        with sub_col1:
-            # Get today's date and time
-            purchase_date = get_purchase_date()
-
-            # Input fields for Vehicle details
-            vin = st.text_input("Vehicle VIN *", max_chars=17)
-
-            # Fetch vehicle data (types, manufacturers, colors)
-            vehicle_data = fetch_vehicle_data()
-            max_year = datetime.now().year + 1
-
-            # Dropdowns for vehicle type, manufacturer, and color
-            vehicle_type = st.selectbox("Vehicle Type *", vehicle_data["vehicle_types"])
-            manufacturer = st.selectbox("Manufacturer *", vehicle_data["manufacturers"])
-            color = st.multiselect("Color *", vehicle_data["colors"])
-            fuel_type = st.selectbox(
-                "Fuel Type *",
-                [
-                    "Gas",
-                    "Diesel",
-                    "Natural Gas",
-                    "Hybrid",
-                    "Plugin Hybrid",
-                    "Battery",
-                    "Fuel Cell",
-                ],
-            )
-            year = st.number_input(
-                "Year *", min_value=1980, max_value=max_year
-            )  # 1886 is the year the first car was made
-
-        with sub_col2:
-            horsepower = st.number_input("Horsepower *", min_value=0)
-            model = st.text_input("Model *")
-            condition = st.selectbox(
-                "Condition *", ["Excellent", "Very Good", "Good", "Fair"]
-            )
-            purchase_price = st.number_input("Purchase Price *")
-            description = st.text_area("Description", max_chars=2054)
+        # Vehicle fields only rerun the page when the form is submitted, not per keystroke
+        with st.form("add_vehicle_form", border=False):
+            sub_col1, sub_col2 = st.columns([1, 1], gap="medium")
+
+            with sub_col1:
+                # Get today's date and time
+                purchase_date = get_purchase_date()
+
+                # Input fields for Vehicle details
+                vin = st.text_input("Vehicle VIN *", max_chars=17)
+
+                # Vehicle types, manufacturers and colors, cached in the controller
+                vehicle_data = get_vehicle_lookups()
+                max_year = datetime.now().year + 1
+
+                # Dropdowns for vehicle type, manufacturer, and color
+                vehicle_type = st.selectbox(
+                    "Vehicle Type *", vehicle_data["vehicle_types"]
+                )
+                manufacturer = st.selectbox(
+                    "Manufacturer *", vehicle_data["manufacturers"]
+                )
+                color = st.multiselect("Color *", vehicle_data["colors"])
+                fuel_type = st.selectbox(
+                    "Fuel Type *",
+                    [
+                        "Gas",
+                        "Diesel",
+                        "Natural Gas",
+                        "Hybrid",
+                        "Plugin Hybrid",
+                        "Battery",
+                        "Fuel Cell",
+                    ],
+                )
+                year = st.number_input(
+                    "Year *", min_value=1980, max_value=max_year
+                )  # 1886 is the year the first car was made
+
+            with sub_col2:
+                horsepower = st.number_input("Horsepower *", min_value=0)
+                model = st.text_input("Model *")
+                condition = st.selectbox(
+                    "Condition *", ["Excellent", "Very Good", "Good", "Fair"]
+                )
+                purchase_price = st.number_input("Purchase Price *")
+                description = st.text_area("Description", max_chars=2054)
+
+            st.write("")
+            submitted = st.form_submit_button("Add Vehicle")
 
     with cols2:
         st.markdown(
@@ -235,8 +219,7 @@ def add_vehicle_page() -> None:
                         if all(customer_data.values()):
                             customer_id = add_new_customer(customer_type, customer_data)
                             if customer_id:
-                                st.success("New customer added successfully!")
-                                time.sleep(2)
+                                flash("New customer added successfully!")
                                 st.rerun()
                         else:
                             st.error("Please fill in required fields.")
@@ -244,30 +227,41 @@ def add_vehicle_page() -> None:
             if not select_customer:
                 st.warning("Select customer first")
             else:
-                customer_id = fetch_customer_id(select_customer)[0]
+                # Cached with the shared read TTL, so reruns don't requery
+                customer_ids = fetch_customer_id(select_customer)
+                customer_id = customer_ids[0] if customer_ids else None
 
                 if customer_id:
                     with cols1:
-                        st.write("")
-                        st.write("")
-
-                        if st.button("Add Vehicle"):
-                            required_fields = [
-                                vin,
-                                vehicle_type,
-                                manufacturer,
-                                model,
-                                year,
-                                condition,
-                                fuel_type,
-                                horsepower,
-                                color,
-                                purchase_price,
-                                purchase_date,
-                                select_customer,
-                            ]
-
-                            if all(required_fields):
+                        if submitted:
+                            # Cheap checks for the common mistakes come first, so a
+                            # malformed vehicle never opens the insert transaction
+                            error = None
+                            if len(vin) != 17:
+                                error = "VIN must be 17 characters."
+                            elif not color:
+                                error = "Select at least one color."
+                            elif purchase_price <= 0:
+                                error = "Purchase price must be greater than zero."
+                            elif horsepower <= 0:
+                                error = "Horsepower must be greater than zero."
+                            elif not validate_required_fields(
+                                [
+                                    vehicle_type,
+                                    manufacturer,
+                                    model,
+                                    year,
+                                    condition,
+                                    fuel_type,
+                                    purchase_date,
+                                    select_customer,
+                                ]
+                            ):
+                                error = "Please fill in all required fields."
+
+                            if error:
+                                st.error(error)
+                            else:
                                 success = add_vehicle_and_related_data(
                                     vin,
                                     vehicle_type,
@@ -4,12 +4,109 @@ from controllers.extract_data import (
     get_vehicle_parts,
     get_purchase_details,
     get_sale_details,
-    update_status,
+    update_part_status,
+    next_part_statuses,
     get_vehicle_details,
 )
 from utils.constants import STATUS_ACCESS_ROLES, VEHICLE_STATUS_OPTIONS
+from utils.flash import flash, show_flash
 import pandas as pd
-import time
+
+
+def _attribute_lines(details: dict) -> str:
+    """
+    Formats a small attribute -> value mapping as one markdown block, one line per attribute.
+
+    Parameters:
+        details (dict): The attributes to display.
+
+    Returns:
+        str: Markdown with a bold attribute name and its value on each line.
+    """
+    return "  \n".join(
+        f"**{attribute}**: {value}" for attribute, value in details.items()
+    )
+
+
+@st.fragment
+def _parts_section(vin: str) -> None:
+    """
+    Renders the parts table and status update controls for a vehicle.
+
+    Runs as a fragment, so updating a part reruns only this section rather than
+    the whole page with its vehicle, purchase and sale lookups.
+
+    Parameters:
+        vin (str): The VIN of the vehicle whose parts are shown.
+
+    Returns:
+        None
+    """
+    # Confirmation from an update made just before this fragment rerun
+    show_flash()
+
+    parts_data = get_vehicle_parts(vin)
+    parts_df = pd.DataFrame(parts_data)
+
+    if parts_df.empty:
+        st.warning("Vehicle has no parts ordered, recieved or installed")
+    else:
+        # Display every part in one table using the full column width
+        st.dataframe(parts_df, use_container_width=True, hide_index=True)
+        st.write("")
+
+    # Status update controls, only for parts that can still move forward
+    for part in parts_data:
+        vendor_part_number = part["VendorPartNumber"]
+        order_number = part["OrderNumber"]
+        status_options = next_part_statuses(part["PartStatus"])
+        if not status_options:
+            continue
+
+        col = st.container()
+        with col:
+            selected_status_key = f"selected_status_{vendor_part_number}"
+            previous_status = st.session_state.get(selected_status_key)
+
+            # Display radio buttons for status selection
+            selected_status = st.radio(
+                f"Update status for {vendor_part_number}:",
+                options=status_options,
+                index=(
+                    status_options.index(previous_status)
+                    if previous_status in status_options
+                    else 0
+                ),
+                key=f"radio_{vendor_part_number}",
+                label_visibility="hidden",
+            )
+
+            # Update the selected status in session state
+            st.session_state[selected_status_key] = selected_status
+
+            if st.button(
+                f"Update {vendor_part_number}",
+                key=f"update_status_{vendor_part_number}",
+            ):
+                if vendor_part_number and order_number:
+                    success = update_part_status(
+                        order_number, vendor_part_number, selected_status
+                    )
+                    if success:
+                        flash(
+                            f"Status updated to {selected_status} for {vendor_part_number}"
+                        )
+                        # The Sell button outside this fragment depends on every part
+                        # being installed, so rerun the whole page only when that flips
+                        all_installed = selected_status == "Installed" and all(
+                            other["PartStatus"] == "Installed"
+                            for other in parts_data
+                            if other is not part
+                        )
+                        st.rerun(scope="app" if all_installed else "fragment")
+                    else:
+                        st.error("Part order number or part number incorrect")
+        st.write("")
 
 
 def vehicle_details_page():
@@ -63,11 +160,7 @@ def vehicle_details_page():
             buyer_details = get_purchase_details(st.session_state["selected_vin"])
 
             if buyer_details:
-                st.dataframe(
-                    pd.DataFrame(buyer_details.items(), columns=["Attribute", "Value"]),
-                    use_container_width=True,
-                    hide_index=True,
-                )
+                st.markdown(_attribute_lines(buyer_details))
             else:
                 st.warning(
                     f"No vehicle with VIN: {st.session_state['selected_vin']} in inventory"
@@ -78,13 +171,7 @@ def vehicle_details_page():
             st.subheader("🚗 Sale Details")
             seller_details = get_sale_details(st.session_state["selected_vin"])
             if seller_details:
-                st.dataframe(
-                    pd.DataFrame(
-                        seller_details.items(), columns=["Attribute", "Value"]
-                    ),
-                    use_container_width=True,
-                    hide_index=True,
-                )
+                st.markdown(_attribute_lines(seller_details))
             else:
                 st.warning(
                     f"Vehicle with VIN: {st.session_state['selected_vin']} has not been sold yet"
@@ -100,86 +187,15 @@ def vehicle_details_page():
             st.subheader("🔩 Parts Section")
             st.write("")
 
-            if not parts_data:
-                st.warning("Vehicle has no parts ordered, recieved or installed")
-            # Display each part using the full column width
-            for part in parts_data:
-
-                # Create a dataframe for the part's details
-                part_df = pd.DataFrame([part])
+            _parts_section(st.session_state["selected_vin"])
 
-                # Display the dataframe using the full width
-                st.dataframe(part_df, use_container_width=True, hide_index=True)
-
-                # Status update functionality
-                if part["PartStatus"] == "Ordered":
-                    status_options = ["Received", "Installed"]
-                elif part["PartStatus"] == "Received":
-                    status_options = ["Installed"]
-                else:
-                    status_options = []
-
-                # Show status options if available
-                if status_options:
-                    col = st.container()
-                    with col:
-                        selected_status_key = (
-                            f"selected_status_{part['VendorPartNumber']}"
-                        )
-                        if selected_status_key not in st.session_state:
-                            st.session_state[selected_status_key] = None
-
-                        # Display radio buttons for status selection
-                        selected_status = st.radio(
-                            f"Update status for {part['VendorPartNumber']}:",
-                            options=status_options,
-                            index=(
-                                status_options.index(
-                                    st.session_state[selected_status_key]
-                                )
-                                if st.session_state[selected_status_key]
-                                else 0
-                            ),
-                            key=f"radio_{part['VendorPartNumber']}",
-                            label_visibility="hidden",
-                        )
-
-                        # Update the selected status in session state
-                        st.session_state[selected_status_key] = selected_status
-
-                        if st.button(
-                            f"Update {part['VendorPartNumber']}",
-                            key=f"update_status_{part['VendorPartNumber']}",
-                        ):
-                            if part["VendorPartNumber"] and part["OrderNumber"]:
-                                success = update_status(
-                                    selected_status,
-                                    part["VendorPartNumber"],
-                                    part["OrderNumber"],
-                                )
-                                if success:
-                                    # Add logic for updating status and rerunning app
-                                    st.success(
-                                        f"Status updated to {selected_status} for {part['VendorPartNumber']}"
-                                    )
-                                    time.sleep(1)
-                                    st.rerun()
-                                else:
-                                    st.error(
-                                        "Part order number or part number incorrect"
-                                    )
-                st.write("")
-                st.write("")
-                st.write("")
-                st.markdown("-----")
+            st.markdown("-----")
             col1, col2, col3, col4 = st.columns([1, 1, 3, 3], gap="small")
 
             if user_role == "Owner":
                 if not vehicle_sold_detail.empty:
-                    st.session_state["all_parts_installed"] = (
-                        all(part["PartStatus"] == "Installed" for part in parts_data)
-                        if parts_data
-                        else True
+                    st.session_state["all_parts_installed"] = all(
+                        part["PartStatus"] == "Installed" for part in parts_data
                     )
                     with col1:
                         # Button to add new parts order
@@ -188,7 +204,9 @@ def vehicle_details_page():
                     with col2:
                         if (
                             st.session_state["all_parts_installed"]
-                            and vehicle_details.to_records()[-1][-1] is None
+                            # The last Attribute/Value row is SaleDate; empty while unsold
+                            and not vehicle_details.empty
+                            and pd.isna(vehicle_details.iat[-1, -1])
                         ):
                             if st.button("🛒 Sell Vehicle"):
                                 st.switch_page(st.Page("pages/sell_vehicle.py"))
@@ -1,6 +1,7 @@
 import streamlit as st
 import pandas as pd
 from controllers.extract_data import monthly_sales_summary, monthly_sales_drilldown
+from utils.reports import format_money
 
 
 df = monthly_sales_summary()
@@ -16,25 +17,28 @@ with cols2:
 st.write("")
 st.write("")
 
+if df.empty:
+    st.info("No data available for this report.")
+    st.stop()
+
 # Add a 'Select' column to the DataFrame
 df["Select"] = False
-df["Gross Sales Income"] = df["Gross Sales Income"].apply(lambda x: f"${x:,.2f}")
-df["Net Income"] = df["Net Income"].apply(lambda x: f"${x:,.2f}")
-df["Year"] = df["Year"].apply(lambda x: f"{x:.0f}")
 
 # Show the search results DataFrame with editable checkbox column
+# Money columns are read-only, as Styler formatting only applies to non-editable columns
+money_columns = ["Gross Sales Income", "Net Income"]
 edited_df = st.data_editor(
-    df,
+    format_money(df, money_columns),
     use_container_width=True,
+    disabled=money_columns,
     column_config={
         "Select": st.column_config.CheckboxColumn(
             "Select to View",
             help="Select this row to view details",
             default=False,
         ),
-        "Year": st.column_config.Column("Year"),
-        "Gross Sales Income": st.column_config.Column("Gross Sales Income"),
-        "Net Income": st.column_config.Column("Net Income"),
+        # Numeric columns keep their values, so they also sort numerically
+        "Year": st.column_config.NumberColumn("Year", format="%d"),
     },
     hide_index=True,
 )
@@ -45,13 +49,13 @@ selected_rows = edited_df[edited_df["Select"] == True]
 
 if not selected_rows.empty:
 
-    # Store selected VIN in session state and navigate
-    for _, row in selected_rows.iterrows():
-        year = int(row["Year"])
-        month = int(row["Month"])
+    # Drill into the last selected month and remember it in session state
+    last_row = selected_rows.iloc[-1]
+    year = int(last_row["Year"])
+    month = int(last_row["Month"])
 
-        st.session_state["selected_year"] = year
-        st.session_state["selected_month"] = month
+    st.session_state["selected_year"] = year
+    st.session_state["selected_month"] = month
 
     drilldown_df = monthly_sales_drilldown(year, month)
 
@@ -66,11 +70,7 @@ if not selected_rows.empty:
                 unsafe_allow_html=True,
             )
         st.dataframe(
-            drilldown_df.style.format(
-                {
-                    "Total Sales": "${:,.2f}",
-                }
-            ),
+            format_money(drilldown_df, ["Total Sales"]),
             use_container_width=True,
             hide_index=True,
         )
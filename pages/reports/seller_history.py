@@ -1,4 +1,5 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
 from controllers.extract_data import seller_history_report
 
@@ -15,24 +16,29 @@ with cols2:
 
 st.write("")
 st.write("")
+
+if df.empty:
+    st.info("No data available for this report.")
+    st.stop()
+
 st.write("* Sellers in red may be overcharging for parts or ordering too many parts.")
 
 # df['Avg Parts Quantity Per Vehicle'] = df['Avg Parts Quantity Per Vehicle'].apply(lambda x: f"${x:,.2f}")
 # df['Avg Parts Cost Per Vehicle'] = df['Avg Parts Cost Per Vehicle'].apply(lambda x: f"${x:,.2f}")
 
+# Build the whole style grid at once: every cell of a flagged seller's row turns red
+flagged = (
+    (df["Avg Parts Quantity Per Vehicle"] >= 5)
+    | (df["Avg Parts Cost Per Vehicle"] >= 500)
+).to_numpy()
+styles = pd.DataFrame(
+    np.broadcast_to(np.where(flagged, "background-color: red", "")[:, None], df.shape),
+    index=df.index,
+    columns=df.columns,
+)
+
 st.dataframe(
-    df.style.apply(
-        lambda x: [
-            (
-                "background-color: red"
-                if (x["Avg Parts Quantity Per Vehicle"] >= 5)
-                or (x["Avg Parts Cost Per Vehicle"] >= 500)
-                else ""
-            )
-            for _ in x
-        ],
-        axis=1,
-    ).format(
+    df.style.apply(lambda _: styles, axis=None).format(
         {
             "Avg Parts Quantity Per Vehicle": "${:,.2f}",
             "Avg Parts Cost Per Vehicle": "${:,.2f}",
@@ -3,17 +3,23 @@ import pandas as pd
 from controllers.extract_data import (
     search_vehicles,
     get_vehicle_counts,
-    fetch_distinct_values_from_table,
+    get_vehicle_lookups,
 )
 from utils.constants import (
     VIN_ACCESS_ROLES,
     STATUS_ACCESS_ROLES,
     VEHICLE_STATUS_OPTIONS,
     FUEL_TYPES,
+    INVENTORY_COUNT_ROLES,
+    SALE_COUNT_ROLES,
+    REPORTS_ROLES,
 )
 from utils.auth import initialize_session_states, clear_search_results
 from datetime import datetime
 
+# Search results shown per page in the results editor
+_RESULTS_PAGE_SIZE = 500
+
 
 def render_page_title(user_role: str, pub_counts: int, pending_part: int) -> None:
     """
@@ -34,13 +40,13 @@ def render_page_title(user_role: str, pub_counts: int, pending_part: int) -> Non
             unsafe_allow_html=True,
         )
 
-    if user_role in ["Manager", "Inventory clerk", "Owner"]:
+    if user_role in INVENTORY_COUNT_ROLES:
         with title_col[2]:
             st.markdown(
                 f"<p style='text-align:right; font-size:20px;'><b>Total Vehicles with Pending Parts:</b> {pending_part}<br><b>Total Vehicles Available for Sale:</b> {pub_counts}</p>",
                 unsafe_allow_html=True,
             )
-    elif user_role in ["Public", "Salesperson"]:
+    elif user_role in SALE_COUNT_ROLES:
         with title_col[2]:
             st.markdown(
                 f"<p style='text-align:right; font-size:20px;'><b>Total Vehicles Available for Sale: {pub_counts}</b></p>",
@@ -48,10 +54,13 @@ def render_page_title(user_role: str, pub_counts: int, pending_part: int) -> Non
             )
 
 
+@st.cache_data(ttl=600, show_spinner=False)
 def fetch_filter_options() -> dict:
     """
     Fetches filter options (vehicle types, manufacturers, years, fuel types, colors) from the database.
 
+    Cached so reruns reuse the assembled lists; the TTL also rolls the year range over at New Year.
+
     Parameters:
         None
 
@@ -61,16 +70,13 @@ def fetch_filter_options() -> dict:
 
     max_year = datetime.now().year + 1
 
-    # Fetch filter options using raw SQL
-    vehicle_types = ["Any"] + fetch_distinct_values_from_table(
-        "VehicleType", "vehicle_type"
-    )
-    manufacturers = ["Any"] + fetch_distinct_values_from_table(
-        "VehicleManufacturer", "manufacturer_name"
-    )
-    years = ["Any"] + sorted(range(1980, max_year + 1))
+    # Fetch all three lookup lists with the single cached UNION ALL query
+    lookups = get_vehicle_lookups()
+    vehicle_types = ["Any"] + lookups["vehicle_types"]
+    manufacturers = ["Any"] + lookups["manufacturers"]
+    years = ["Any", *range(1980, max_year + 1)]
     fuel_types = ["Any"] + FUEL_TYPES
-    colors = ["Any"] + fetch_distinct_values_from_table("Color", "color_name")
+    colors = ["Any"] + lookups["colors"]
 
     return {
         "vehicle_types": vehicle_types,
@@ -156,7 +162,7 @@ def search_page() -> None:
     user_role = st.session_state.get("role", "Public")
 
     # Clear reports section on logout or if user is not Manager or Owner
-    if not is_logged_in or user_role not in ["Manager", "Owner"]:
+    if not is_logged_in or user_role not in REPORTS_ROLES:
         st.session_state["show_reports"] = False
 
     # Clear search results only if login status changes
@@ -200,7 +206,7 @@ def search_page() -> None:
 
         with sub_col2:
             # Show "Show Reports" button only if the user is a Manager or Owner
-            if is_logged_in and user_role in ["Manager", "Owner"]:
+            if is_logged_in and user_role in REPORTS_ROLES:
                 if st.button("Show Reports"):
                     st.session_state["show_reports"] = not st.session_state[
                         "show_reports"
@@ -208,43 +214,68 @@ def search_page() -> None:
                     st.rerun()
 
     if search_button:
-        # Fetch search results
-        results_df = search_vehicles(
-            vehicle_type=vehicle_type,
-            manufacturer=manufacturer,
-            year=year,
-            fuel_type=fuel_type,
-            color=color,
-            keyword=keyword,
-            vin=vin if vin else None,
-            vehicle_status=vehicle_status if vehicle_status else None,
-            role=user_role,
-        )
+        # Remember the criteria; results are fetched a page at a time below
+        search_criteria = {
+            "vehicle_type": vehicle_type,
+            "manufacturer": manufacturer,
+            "year": year,
+            "fuel_type": fuel_type,
+            "color": color,
+            "keyword": keyword,
+            "vin": vin if vin else None,
+            "vehicle_status": vehicle_status if vehicle_status else None,
+            "role": user_role,
+        }
+
+        # Re-pressing Search with unchanged criteria keeps the current page and ticks
+        if search_criteria != st.session_state.get("search_results"):
+            # New results get fresh page and selection widgets
+            st.session_state["results_version"] = (
+                st.session_state.get("results_version", 0) + 1
+            )
 
-        # Store results in session state if not empty
-        if not results_df.empty:
-            st.session_state["search_results"] = results_df
-            st.session_state["no_results"] = False
-        else:
-            st.session_state["search_results"] = None
-            st.session_state["no_results"] = True
+            # Store the criteria in session state if the first page is not empty
+            first_page = search_vehicles(
+                **search_criteria, limit=_RESULTS_PAGE_SIZE + 1, offset=0
+            )
+            if not first_page.empty:
+                st.session_state["search_results"] = search_criteria
+                st.session_state["no_results"] = False
+            else:
+                st.session_state["search_results"] = None
+                st.session_state["no_results"] = True
 
     # Display search results if available in session state
     if (
         "search_results" in st.session_state
         and st.session_state["search_results"] is not None
     ):
-        df = st.session_state["search_results"]
-
-        # Add an empty column for selection
-        df["Select"] = False
+        results_version = st.session_state.get("results_version", 0)
+        page_key = f"results_page_{results_version}"
+        page = st.session_state.get(page_key, 0)
+
+        # Fetch only the visible page, plus one row to tell whether another page follows
+        df = search_vehicles(
+            **st.session_state["search_results"],
+            limit=_RESULTS_PAGE_SIZE + 1,
+            offset=page * _RESULTS_PAGE_SIZE,
+        )
+        # Go back to the first page if the results shrank below the stored page
+        if page > 0 and df.empty:
+            st.session_state[page_key] = 0
+            st.rerun()
+        has_next_page = len(df) > _RESULTS_PAGE_SIZE
+        page_df = df.iloc[:_RESULTS_PAGE_SIZE]
 
         st.write("")
         st.write("")
         st.write("")
-        # Show the search results DataFrame with editable checkbox column
-        edited_df = st.data_editor(
-            df,
+        # Show the page with an editable checkbox column added to a view, leaving the
+        # cached results untouched; the key ties the ticks to this page of these results
+        editor_key = f"results_editor_{results_version}_{page}"
+        st.data_editor(
+            page_df.assign(Select=False),
+            key=editor_key,
             use_container_width=True,
             column_config={
                 "Select": st.column_config.CheckboxColumn(
@@ -253,11 +284,34 @@ def search_page() -> None:
                     default=False,
                 )
             },
+            disabled=list(page_df.columns),
             hide_index=True,
         )
 
-        # Capture selected rows based on the "Select" checkbox column
-        selected_rows = edited_df[edited_df["Select"] == True]["VIN"].tolist()
+        if page > 0 or has_next_page:
+            prev_col, page_col, next_col = st.columns([1, 1, 1])
+            with prev_col:
+                if st.button("Previous Page", disabled=page == 0):
+                    st.session_state[page_key] = page - 1
+                    st.rerun()
+            with page_col:
+                st.write(f"Page {page + 1}")
+            with next_col:
+                if st.button("Next Page", disabled=not has_next_page):
+                    st.session_state[page_key] = page + 1
+                    st.rerun()
+
+        # Only the first ticked row is opened; find it from the editor's delta
+        # rather than filtering the full edited frame
+        edited_rows = st.session_state[editor_key]["edited_rows"]
+        selected_vin = next(
+            (
+                page_df["VIN"].iat[row]
+                for row, changes in sorted(edited_rows.items())
+                if changes.get("Select")
+            ),
+            None,
+        )
 
         view_button = st.button("View Selected Details")
 
@@ -265,8 +319,8 @@ def search_page() -> None:
         with co1:
             st.warning("Select vehicle to view details")
 
-        if view_button and selected_rows:
-            st.session_state["selected_vin"] = selected_rows[0]
+        if view_button and selected_vin:
+            st.session_state["selected_vin"] = selected_vin
             # clear_search_results()  # Optionally clear if switching to details
             st.switch_page(st.Page("pages/details.py"))
     elif st.session_state.get("no_results", False):
@@ -8,7 +8,7 @@ from controllers.extract_data import (
 from pages.add_vehicle import add_new_customer
 from datetime import datetime
 import pandas as pd
-import time
+from utils.flash import flash, show_flash
 
 
 def sell_vehicle_page() -> None:
@@ -21,6 +21,7 @@ def sell_vehicle_page() -> None:
     Returns:
         None
     """
+    show_flash()
     st.markdown(
         "<h4 style=text-align:center;>Sell Vehicle</h4>", unsafe_allow_html=True
     )
@@ -53,7 +54,10 @@ def sell_vehicle_page() -> None:
         st.subheader("📋 General Vehicle Details")
         st.write("")
         sale_data = pd.DataFrame(
-            vehicle_details.items(), columns=["Attributes", "Value"]
+            {
+                "Attributes": list(vehicle_details.keys()),
+                "Value": list(vehicle_details.values()),
+            }
         )
         st.dataframe(sale_data, use_container_width=True, hide_index=True, height=495)
 
@@ -73,33 +77,43 @@ def sell_vehicle_page() -> None:
 
         if select_customer == "Add New Buyer":
             with st.expander("Add Buyer"):
-                cus_col1, cus_col2 = st.columns([1, 1], gap="medium")
-                with cus_col1:
-                    customer_email = st.text_input("Email *")
-                    customer_phone = st.text_input("Phone Number *")
-                    address_street = st.text_input("Street Address *")
-                    address_city = st.text_input("City *")
-                    address_state = st.text_input("State *")
-
-                with cus_col2:
-                    address_postal_code = st.text_input("Postal Code *")
-                    customer_type = st.selectbox(
-                        "Customer Type *", ["Individual", "Business"]
-                    )
+                # The type picks which fields are shown, so it stays outside the form
+                customer_type = st.selectbox(
+                    "Customer Type *", ["Individual", "Business"]
+                )
 
-                    if customer_type == "Individual":
-                        first_name = st.text_input("First Name *")
-                        last_name = st.text_input("Last Name *")
-                        social_security_number = st.text_input(
-                            "Social Security Number *"
-                        )
-                    else:  # Business
-                        business_name = st.text_input("Business Name *")
-                        tax_id_number = st.text_input("Tax Identification Number *")
-                        primary_contact_name = st.text_input("Primary Contact Name *")
-                        primary_contact_title = st.text_input("Primary Contact Title *")
+                # The remaining fields only rerun the page when the buyer is published
+                with st.form("add_buyer_form", border=False):
+                    cus_col1, cus_col2 = st.columns([1, 1], gap="medium")
+                    with cus_col1:
+                        customer_email = st.text_input("Email *")
+                        customer_phone = st.text_input("Phone Number *")
+                        address_street = st.text_input("Street Address *")
+                        address_city = st.text_input("City *")
+                        address_state = st.text_input("State *")
+
+                    with cus_col2:
+                        address_postal_code = st.text_input("Postal Code *")
+
+                        if customer_type == "Individual":
+                            first_name = st.text_input("First Name *")
+                            last_name = st.text_input("Last Name *")
+                            social_security_number = st.text_input(
+                                "Social Security Number *"
+                            )
+                        else:  # Business
+                            business_name = st.text_input("Business Name *")
+                            tax_id_number = st.text_input("Tax Identification Number *")
+                            primary_contact_name = st.text_input(
+                                "Primary Contact Name *"
+                            )
+                            primary_contact_title = st.text_input(
+                                "Primary Contact Title *"
+                            )
 
-                if st.button("Publish Buyer"):
+                    submitted = st.form_submit_button("Publish Buyer")
+
+                if submitted:
                     customer_data = {
                         "customer_type": customer_type,
                         "email": customer_email,
@@ -131,8 +145,7 @@ def sell_vehicle_page() -> None:
                     if all(customer_data.values()):
                         customer_id = add_new_customer(customer_type, customer_data)
                         if customer_id:
-                            st.success("Buyer added successfully!")
-                            time.sleep(2)
+                            flash("Buyer added successfully!")
                             st.rerun()
                         else:
                             st.error("Failed to add buyer. Please try again.")
@@ -142,30 +155,28 @@ def sell_vehicle_page() -> None:
             if not select_customer:
                 st.warning("Select customer first")
             else:
-                customer_id = fetch_customer_id(select_customer)[0]
-
-                if customer_id:
-                    st.write("")
-                    st.write("")
-                    if st.button("Confirm Sale", key="confirm_sale_button"):
-                        if st.session_state.get("selected_vin") and select_customer:
-                            success = record_sale(
-                                vin=st.session_state.get("selected_vin"),
-                                customer_identifier=customer_id,
-                                sale_price=vehicle_details["SalePrice"],
-                                sale_date=datetime.now(),
-                                username=st.session_state["username"],
-                            )
+                st.write("")
+                st.write("")
+                if st.button("Confirm Sale", key="confirm_sale_button"):
+                    # Resolve the buyer's ID only when the sale is confirmed
+                    customer_ids = fetch_customer_id(select_customer)
+                    if st.session_state.get("selected_vin") and customer_ids:
+                        success = record_sale(
+                            vin=st.session_state.get("selected_vin"),
+                            customer_identifier=customer_ids[0],
+                            sale_price=vehicle_details["SalePrice"],
+                            sale_date=datetime.now(),
+                            username=st.session_state["username"],
+                        )
 
-                            if success:
-                                st.success(f"Vehicle sold to customer successfully!")
-                                time.sleep(1)
-                                st.rerun()
-                                st.switch_page(st.Page("pages/details.py"))
-                            else:
-                                st.error("Failed to record sale. Please try again.")
+                        if success:
+                            flash("Vehicle sold to customer successfully!")
+                            st.rerun()
+                            st.switch_page(st.Page("pages/details.py"))
                         else:
-                            st.error("Please select a vehicle and buyer.")
+                            st.error("Failed to record sale. Please try again.")
+                    else:
+                        st.error("Please select a vehicle and buyer.")
 
 
 # Call the function to render the page
@@ -0,0 +1,50 @@
+import unittest
+
+from controllers.extract_data import (
+    _build_search_query,
+    _fulltext_terms,
+    _search_params,
+)
+
+
+class SearchKeywordTest(unittest.TestCase):
+    """Keyword handling in vehicle search never drops the keyword filter."""
+
+    def assert_plain_text_filter(self, keyword: str) -> None:
+        params = _search_params(keyword=keyword)
+        self.assertEqual(params, {"keyword_like": f"%{keyword}%"})
+
+        query = _build_search_query("Public", None, tuple(params)).text
+        self.assertIn("LIKE :keyword_like", query)
+        self.assertNotIn("AGAINST", query)
+
+    def test_words_use_fulltext_prefix_terms(self):
+        self.assertEqual(_fulltext_terms("red civic"), "+red* +civic*")
+        self.assertEqual(
+            _search_params(keyword="red civic"), {"keyword": "+red* +civic*"}
+        )
+
+    def test_numeric_keyword_also_matches_year(self):
+        self.assertEqual(
+            _search_params(keyword="2019"),
+            {"keyword": "+2019*", "year_like": "%2019%"},
+        )
+
+    def test_operator_only_keywords_keep_a_filter(self):
+        for keyword in ["-", "+", '"', "*", "()", "+-~"]:
+            with self.subTest(keyword=keyword):
+                self.assertEqual(_fulltext_terms(keyword), "")
+                self.assert_plain_text_filter(keyword)
+
+    def test_whitespace_only_keywords_keep_a_filter(self):
+        for keyword in [" ", "   ", "\t"]:
+            with self.subTest(keyword=keyword):
+                self.assert_plain_text_filter(keyword)
+
+    def test_empty_keyword_adds_no_filter(self):
+        self.assertEqual(_search_params(keyword=""), {})
+        self.assertEqual(_search_params(keyword=None), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,23 +1,28 @@
 from db.session import create_session
+import hmac
 import streamlit as st
-from typing import Optional, Dict
-from utils.constants import VIN_ACCESS_ROLES, STATUS_ACCESS_ROLES
+from sqlalchemy import text
+from typing import NamedTuple, Optional, Dict
+from utils.constants import VIN_ACCESS_ROLES, STATUS_ACCESS_ROLES, ROLE_IDS, Role
 
 
 def initialize_session_states() -> None:
     """
     Initializes session state variables for login and search results.
 
+    Runs once per session; the "_init_done" sentinel makes later calls a no-op.
+
     Parameters:
         None
 
     Returns:
         None
     """
-    if "prev_logged_in" not in st.session_state:
-        st.session_state["prev_logged_in"] = False
-    if "search_results" not in st.session_state:
-        st.session_state["search_results"] = None
+    if st.session_state.get("_init_done"):
+        return
+    st.session_state.update(
+        {"prev_logged_in": False, "search_results": None, "_init_done": True}
+    )
 
 
 def clear_search_results() -> None:
@@ -60,7 +65,22 @@ def has_status_access(role: str) -> bool:
     return role in STATUS_ACCESS_ROLES
 
 
-def login_user(username: str, password: str) -> Optional[Dict[str, str]]:
+class AuthedUser(NamedTuple):
+    """An authenticated user's username and role."""
+
+    username: str
+    role: str
+
+
+# SQL query to fetch a user's stored password and role by primary key
+_USER_CREDENTIALS_QUERY = text(
+    """
+    SELECT username, role, password FROM User WHERE username = :username
+"""
+)
+
+
+def login_user(username: str, password: str) -> Optional[AuthedUser]:
     """
     Authenticates a user by checking the provided username and password.
 
@@ -69,19 +89,19 @@ def login_user(username: str, password: str) -> Optional[Dict[str, str]]:
         password (str): The password entered by the user.
 
     Returns:
-        Optional[Dict[str, str]]: A dictionary containing the user's username and role if authentication succeeds, otherwise None.
+        Optional[AuthedUser]: The user's username and role if authentication succeeds, otherwise None.
     """
     with create_session() as session:
-        query = """
-            SELECT username, role FROM User WHERE username = :username AND password = :password
-        """
         result = session.execute(
-            query, {"username": username, "password": password}
+            _USER_CREDENTIALS_QUERY, {"username": username}
         ).fetchone()
 
-        if result:
-            return {"username": result[0], "role": result[1]}
-        return None
+    # Compare in constant time so response timing does not leak how much of the password matched
+    if result and hmac.compare_digest(
+        result[2].encode("utf-8"), password.encode("utf-8")
+    ):
+        return AuthedUser(result[0], result[1])
+    return None
 
 
 def clear_session_state() -> None:
@@ -97,6 +117,8 @@ def clear_session_state() -> None:
     st.session_state["logged_in"] = False
     st.session_state["username"] = ""
     st.session_state["role"] = "Public"
+    st.session_state["role_id"] = Role.PUBLIC
+    st.session_state["_welcome_md"] = ""
 
 
 def logout_user() -> None:
@@ -164,8 +186,10 @@ def login() -> None:
         user = login_user(form_data["username"], form_data["password"])
         if user:
             st.session_state["logged_in"] = True
-            st.session_state["username"] = user["username"]
-            st.session_state["role"] = user["role"]
+            st.session_state["username"] = user.username
+            st.session_state["role"] = user.role
+            st.session_state["role_id"] = ROLE_IDS.get(user.role, Role.PUBLIC)
+            st.session_state["_welcome_md"] = f"**Welcome, {user.username}!**"
             st.rerun()
         else:
             with cols2:
@@ -1,8 +1,39 @@
-# User roles with access to VIN filter
-VIN_ACCESS_ROLES = ["Inventory Clerk", "Salesperson", "Manager", "Owner"]
+from enum import IntEnum
+
+
+class Role(IntEnum):
+    """Integer identifiers for user roles, used to index role-based lookup tables."""
+
+    INVENTORY_CLERK = 0
+    SALESPERSON = 1
+    MANAGER = 2
+    OWNER = 3
+    PUBLIC = 4
+
+
+# Role names as stored in the User table, mapped to their Role identifier
+ROLE_IDS = {
+    "Inventory clerk": Role.INVENTORY_CLERK,
+    "Salesperson": Role.SALESPERSON,
+    "Manager": Role.MANAGER,
+    "Owner": Role.OWNER,
+    "Public": Role.PUBLIC,
+}
+
+# User roles with access to VIN filter, spelled as the role keys in ROLE_IDS
+VIN_ACCESS_ROLES = frozenset({"Inventory clerk", "Salesperson", "Manager", "Owner"})
 
 # User roles with access to Vehicle Status filter
-STATUS_ACCESS_ROLES = ["Manager", "Owner"]
+STATUS_ACCESS_ROLES = frozenset({"Manager", "Owner"})
+
+# User roles shown both the pending-parts and available-for-sale counts
+INVENTORY_COUNT_ROLES = frozenset({"Manager", "Inventory clerk", "Owner"})
+
+# User roles shown only the available-for-sale count
+SALE_COUNT_ROLES = frozenset({"Public", "Salesperson"})
+
+# User roles that can open the Reports section
+REPORTS_ROLES = frozenset({"Manager", "Owner"})
 
 # Options for vehicle status radio button
 VEHICLE_STATUS_OPTIONS = ["All Vehicles", "Sold", "Unsold"]
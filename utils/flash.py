@@ -0,0 +1,33 @@
+import streamlit as st
+
+_FLASH_KEY = "_flash_message"
+
+
+def flash(message: str, icon: str = "✅") -> None:
+    """
+    Queues a confirmation to show as a toast on the next run, e.g. just before st.rerun().
+
+    Parameters:
+        message (str): The confirmation text.
+        icon (str): The toast icon.
+
+    Returns:
+        None
+    """
+    st.session_state[_FLASH_KEY] = (message, icon)
+
+
+def show_flash() -> None:
+    """
+    Shows and clears the confirmation queued by flash(), if any.
+
+    Parameters:
+        None
+
+    Returns:
+        None
+    """
+    queued = st.session_state.pop(_FLASH_KEY, None)
+    if queued:
+        message, icon = queued
+        st.toast(message, icon=icon)
@@ -0,0 +1,61 @@
+import streamlit as st
+import pandas as pd
+from pandas.io.formats.style import Styler
+from typing import Iterable
+
+# Dollar amounts with thousands separators, e.g. $1,234,567.89
+MONEY_FORMAT = "${:,.2f}"
+
+
+def format_money(df: pd.DataFrame, money_columns: Iterable[str]) -> Styler:
+    """
+    Formats the given columns of a report frame as dollar amounts.
+
+    Only the displayed text is formatted; the values stay numeric, so the columns
+    still sort by amount.
+
+    Parameters:
+        df (pd.DataFrame): The report rows.
+        money_columns (Iterable[str]): Columns to display as dollar amounts.
+
+    Returns:
+        Styler: The frame with its money columns formatted.
+    """
+    return df.style.format(MONEY_FORMAT, subset=list(money_columns), na_rep="")
+
+
+def render_table_report(
+    title: str, df: pd.DataFrame, money_columns: Iterable[str] = ()
+) -> None:
+    """
+    Renders a report page: a centred heading followed by the report table.
+
+    Parameters:
+        title (str): The report heading.
+        df (pd.DataFrame): The report rows, as returned by the cached controller.
+        money_columns (Iterable[str]): Columns to display as dollar amounts.
+
+    Returns:
+        None
+    """
+    cols1, cols2, cols3 = st.columns([1, 1, 1], gap="medium")
+
+    with cols2:
+        st.markdown(
+            f"<h4 style=text-align:center;>{title}</h4>",
+            unsafe_allow_html=True,
+        )
+
+    st.write("")
+    st.write("")
+
+    if df.empty:
+        st.info("No data available for this report.")
+        return
+
+    money_columns = list(money_columns)
+    st.dataframe(
+        format_money(df, money_columns) if money_columns else df,
+        use_container_width=True,
+        hide_index=True,
+    )